@@ -13,9 +13,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from indic_text_normalization.normalize import Normalizer
+from indic_text_normalization.normalize import Normalizer, warmup
 
-__all__ = ['Normalizer']
+__all__ = ['Normalizer', 'warmup']
 __version__ = '1.0.0'
 
 from indic_text_normalization.normalize import Normalizer
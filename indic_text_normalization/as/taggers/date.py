@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from ..graph_utils import (
     NEMO_DIGIT,
     NEMO_HI_DIGIT,
@@ -26,11 +27,8 @@ from ..graph_utils import (
 from ..utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Hindi digits (०-९)
-arabic_to_hindi_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_hindi_number = pynini.closure(arabic_to_hindi_digit).optimize()
+arabic_to_hindi_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
+arabic_to_hindi_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 days = pynini.string_file(get_abs_path("data/date/days.tsv"))
 months = pynini.string_file(get_abs_path("data/date/months.tsv"))
@@ -22,13 +22,11 @@ from indic_text_normalization.hi.graph_utils import (
     GraphFst,
 )
 from indic_text_normalization.hi.utils import get_abs_path
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 
 # Convert Arabic digits (0-9) to Hindi digits (०-९)
-arabic_to_hindi_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_hindi_number = pynini.closure(arabic_to_hindi_digit).optimize()
+arabic_to_hindi_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
+arabic_to_hindi_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 
 class FractionFst(GraphFst):
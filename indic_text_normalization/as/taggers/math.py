@@ -15,6 +15,8 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import load_string_file
 from ..graph_utils import (
     NEMO_DIGIT,
     NEMO_AS_DIGIT,
@@ -26,18 +28,15 @@ from ..graph_utils import (
 from ..utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Assamese digits (০-৯)
-arabic_to_assamese_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_assamese_number = pynini.closure(arabic_to_assamese_digit).optimize()
+arabic_to_assamese_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_assamese_number = arabic_to_native_number(BENGALI_DIGITS)
 
 # Keep old names for backward compatibility
 arabic_to_hindi_digit = arabic_to_assamese_digit
 arabic_to_hindi_number = arabic_to_assamese_number
 
 # Load math operations (Assamese version)
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
 
 class MathFst(GraphFst):
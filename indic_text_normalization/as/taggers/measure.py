@@ -36,13 +36,12 @@ from indic_text_normalization.hi.graph_utils import (
     insert_space,
 )
 from indic_text_normalization.hi.utils import get_abs_path
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import load_string_file
 
 # Convert Arabic digits (0-9) to Hindi digits (०-९)
-arabic_to_hindi_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_hindi_number = pynini.closure(arabic_to_hindi_digit).optimize()
+arabic_to_hindi_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
+arabic_to_hindi_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 HI_POINT_FIVE = ".५"  # .5
 HI_ONE_POINT_FIVE = "१.५"  # 1.5
@@ -384,7 +383,7 @@ class MeasureFst(GraphFst):
         math = None
         try:
             if os.path.exists(math_operations_path):
-                math_operations = pynini.string_file(math_operations_path)
+                math_operations = load_string_file(math_operations_path)
                 delimiter = pynini.accep(" ") | pynutil.insert(" ")
                 
                 math_expr = (
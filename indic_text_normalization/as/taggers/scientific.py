@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from ..graph_utils import GraphFst, NEMO_DIGIT, NEMO_AS_DIGIT, insert_space
 
 
@@ -37,21 +38,8 @@ class ScientificFst(GraphFst):
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
 
         # Arabic digits -> Assamese digits
-        arabic_to_assamese_digit = pynini.string_map(
-            [
-                ("0", "০"),
-                ("1", "১"),
-                ("2", "২"),
-                ("3", "৩"),
-                ("4", "৪"),
-                ("5", "৫"),
-                ("6", "৬"),
-                ("7", "৭"),
-                ("8", "৮"),
-                ("9", "৯"),
-            ]
-        ).optimize()
-        arabic_to_assamese_number = pynini.closure(arabic_to_assamese_digit).optimize()
+        arabic_to_assamese_digit = arabic_to_native_digit(BENGALI_DIGITS)
+        arabic_to_assamese_number = arabic_to_native_number(BENGALI_DIGITS)
 
         # Integer part for mantissa
         assamese_int = pynini.compose(pynini.closure(NEMO_AS_DIGIT, 1), cardinal_graph).optimize()
@@ -16,6 +16,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit
 from ..graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -46,10 +47,7 @@ credit_context = pynini.string_file(get_abs_path("data/telephone/credit_context.
 pincode_context = pynini.string_file(get_abs_path("data/telephone/pincode_context.tsv"))
 
 # Convert Arabic digits (0-9) to Hindi digits (०-९) for pattern matching
-arabic_to_hindi_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
+arabic_to_hindi_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
 
 # Reusable optimized graph for any digit token
 # Supports both Arabic digits (via digit_to_word) and Hindi digits (via digits)
@@ -75,7 +75,7 @@ class MoneyFst(GraphFst):
         
         integer = pynutil.insert('integer_part: "') + number_cardinal + pynutil.insert('"')
         fraction = pynutil.insert('fractional_part: "') + number_cardinal + pynutil.insert('"')
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         # Optional Bhojpuri suffixes after money amount
         optional_suffix = pynini.closure(pynutil.delete(bhojpuri_suffixes), 0, 1)
@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 import string
@@ -24,12 +25,15 @@ from pynini import Far
 from pynini.export import export
 from pynini.lib import byte, pynutil, utf8
 
+from indic_text_normalization import graph_cache
+from indic_text_normalization.digit_maps import BENGALI_DIGITS
+
 NEMO_CHAR = utf8.VALID_UTF8_CHAR
 NEMO_DIGIT = byte.DIGIT
 
-# Bengali digits (০-৯)
-NEMO_BN_DIGIT = pynini.union("০", "১", "২", "৩", "৪", "৫", "৬", "৭", "৮", "৯").optimize()
-NEMO_BN_NON_ZERO = pynini.union("১", "২", "৩", "৪", "৫", "৬", "৭", "৮", "৯").optimize()
+# Bengali digits (০-৯), input label sorted so closures over them compose with binary search arc matching
+NEMO_BN_DIGIT = pynini.union(*[pynini.accep(digit) for digit in BENGALI_DIGITS]).optimize().arcsort("ilabel")
+NEMO_BN_NON_ZERO = pynini.union(*[pynini.accep(digit) for digit in BENGALI_DIGITS[1:]]).optimize().arcsort("ilabel")
 NEMO_BN_ZERO = "০"
 
 # Superscript characters for powers/exponents
@@ -121,6 +125,10 @@ def generator_main(file_name: str, graphs: Dict[str, 'pynini.FstLike']):
     logging.info(f'Created {file_name}')
 
 
+# Cache key of a graph built with this module, see graph_cache.get_cache_key()
+get_cache_key = functools.partial(graph_cache.get_cache_key, modules=[__file__])
+
+
 def convert_space(fst) -> 'pynini.FstLike':
     """
     Converts space to nonbreaking space.
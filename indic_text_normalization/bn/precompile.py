@@ -0,0 +1,59 @@
+# Copyright (c) 2025, Kenpath Technologies Pvt Ltd.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from argparse import ArgumentParser
+from typing import List
+
+from indic_text_normalization.bn.graph_utils import INPUT_CASED, INPUT_LOWER_CASED
+from indic_text_normalization.bn.taggers.tokenize_and_classify import PREBUILT_DIR, ClassifyFst
+
+"""
+Compiles the Bengali tokenize and classify grammars into data/prebuilt before the package is built,
+so that they are shipped with the wheel and ClassifyFst loads them instead of building them on first use:
+
+    python -m indic_text_normalization.bn.precompile
+
+The FAR names include a hash of the package version and the grammar sources, so the grammars have to be
+compiled again for every release and grammar change, and stale FAR files are ignored rather than loaded.
+"""
+
+
+def precompile(input_cases: List[str], output_dir: str = PREBUILT_DIR):
+    """
+    Compiles the deterministic ClassifyFst of each input case into output_dir.
+
+    Args:
+        input_cases: input cases to compile the grammars for, "lower_cased" or "cased"
+        output_dir: directory the FAR files are written to
+    """
+    for input_case in input_cases:
+        ClassifyFst(input_case=input_case, deterministic=True, cache_dir=output_dir, overwrite_cache=True)
+
+
+def parse_args():
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--input_case",
+        help="input cases to compile the grammars for",
+        choices=[INPUT_CASED, INPUT_LOWER_CASED],
+        nargs="+",
+        default=[INPUT_CASED, INPUT_LOWER_CASED],
+    )
+    parser.add_argument("--output_dir", help="directory the FAR files are written to", type=str, default=PREBUILT_DIR)
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    precompile(args.input_case, args.output_dir)
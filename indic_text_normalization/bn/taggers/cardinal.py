@@ -12,28 +12,54 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import os
+import threading
+from typing import Dict
+
 import pynini
 from pynini.lib import pynutil
 
-from indic_text_normalization.bn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_BN_DIGIT, NEMO_SPACE, insert_space
-from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.bn.graph_utils import (
+    NEMO_BN_DIGIT,
+    NEMO_DIGIT,
+    NEMO_SPACE,
+    GraphFst,
+    get_cache_key,
+    insert_space,
+)
+from indic_text_normalization.bn.utils import get_abs_path, load_labels
+from indic_text_normalization.digit_maps import (
+    BENGALI_DIGITS,
+    arabic_to_native_digit,
+    arabic_to_native_number,
+    arabic_to_native_table,
+)
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build, load_string_file
 
 # Convert Arabic digits (0-9) to Bengali digits (০-৯)
-arabic_to_bengali_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_bengali_number = pynini.closure(arabic_to_bengali_digit).optimize()
+arabic_to_bengali_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_bengali_number = arabic_to_native_number(BENGALI_DIGITS)
+arabic_to_bengali_table = arabic_to_native_table(BENGALI_DIGITS)
+
+# Suffix of each magnitude above hundreds and the number of digits following its leading digit
+MAGNITUDE_TIERS = [(" হাজার", 3), (" লক্ষ", 5), (" কোটি", 7)]
+
+# Deletion of k zeros following a magnitude suffix, for k up to the number of digits after a crore
+ZERO_POW = [pynini.accep("")] + [pynutil.add_weight(pynutil.delete("০"), -0.1) ** k for k in range(1, 8)]
+
+# Prefix of the non-terminal labels standing for the number graphs of each number of digits
+TIER_NONTERMINAL = "BN_CARDINAL_TIER_"
 
 # Load math operations
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
 
 class CardinalFst(GraphFst):
     """
     Finite state transducer for classifying cardinals, e.g.
         -২৩ -> cardinal { negative: "true"  integer: "তেইশ" }
-        1,000,001 -> cardinal { integer: "দশ লক্ষ এক" }
+        1000001 -> cardinal { integer: "দশ লক্ষ এক" }
 
     Args:
         deterministic: if True will provide a single transduction option,
@@ -43,172 +69,171 @@ class CardinalFst(GraphFst):
     def __init__(self, deterministic: bool = True, lm: bool = False):
         super().__init__(name="cardinal", kind="classify", deterministic=deterministic)
 
-        digit = pynini.string_file(get_abs_path("data/numbers/digit.tsv"))
-        zero = pynini.string_file(get_abs_path("data/numbers/zero.tsv"))
-        teens_ties = pynini.string_file(get_abs_path("data/numbers/teens_and_ties.tsv"))
+        data_files = [get_abs_path(f"data/numbers/{name}.tsv") for name in ("digit", "zero", "teens_and_ties")]
+        digit, zero, teens_ties = [pynini.string_file(data_file) for data_file in data_files]
         teens_and_ties = pynutil.add_weight(teens_ties, -0.1)
 
         self.digit = digit
         self.zero = zero
         self.teens_and_ties = teens_and_ties
 
-        def create_graph_suffix(digit_graph, suffix, zeros_counts):
-            zero = pynutil.add_weight(pynutil.delete("০"), -0.1)
-            if zeros_counts == 0:
-                return digit_graph + suffix
+        # Building the number graph is slow, so it is cached on disk keyed by the grammar and data files
+        self.cache_key = get_cache_key([__file__] + data_files, deterministic, lm)
+        far_file = os.path.join(CACHE_DIR, f"bn_cardinal_{self.cache_key}.far")
+        graphs = load_or_build(far_file, lambda: self._build_graphs(digit, zero, teens_ties, teens_and_ties))
+        for rule, graph in graphs.items():
+            setattr(self, rule, graph)
+        # Other taggers compose their digit inputs with the number graph
+        self.final_graph.arcsort("ilabel")
 
-            return digit_graph + (zero**zeros_counts) + suffix
+        optional_minus_graph = pynini.closure(pynutil.insert("negative: ") + pynini.cross("-", "\"true\" "), 0, 1)
 
-        def create_larger_number_graph(digit_graph, suffix, zeros_counts, sub_graph):
-            insert_space = pynutil.insert(" ")
-            zero = pynutil.add_weight(pynutil.delete("০"), -0.1)
-            if zeros_counts == 0:
-                return digit_graph + suffix + insert_space + sub_graph
+        final_graph = optional_minus_graph + pynutil.insert("integer: \"") + self.final_graph + pynutil.insert("\"")
+        final_graph = self.add_tokens(final_graph)
+        self.fst = final_graph
 
-            return digit_graph + suffix + (zero**zeros_counts) + insert_space + sub_graph
+    @staticmethod
+    def verbalize_int(n: int) -> str:
+        """
+        Verbalizes a non-negative integer of up to 9 digits without building any graph,
+        giving the same reading as the deterministic number graph, e.g. 1000001 -> দশ লক্ষ এক
+
+        Args:
+            n: integer to verbalize
+        """
+        if not 0 <= n < 10**9:
+            raise ValueError(f"{n} is outside of the cardinal range")
+        words = _number_words()
+        if n == 0:
+            return words["০"]
+        parts = []
+        for suffix, total_zeros in reversed([(" শত", 2)] + MAGNITUDE_TIERS):
+            prefix, n = divmod(n, 10**total_zeros)
+            if prefix:
+                parts.append(words[str(prefix).translate(arabic_to_bengali_table)] + suffix)
+        if n:
+            parts.append(words[str(n).translate(arabic_to_bengali_table)])
+        return " ".join(parts)
+
+    def _build_graphs(self, digit, zero, teens_ties, teens_and_ties):
+        """
+        Builds the number graphs, returns a mapping of attribute names to graphs
+        """
+
+        def build_tier(prefix_graph, suffix, total_zeros, graphs_by_length):
+            """
+            Unions the prefix followed by the suffix with every possible remainder of total_zeros digits,
+            where graphs_by_length maps a number of digits to the graph verbalizing them
+            """
+            graph = prefix_graph + suffix + ZERO_POW[total_zeros]
+            for zeros_counts in range(total_zeros - 1, -1, -1):
+                sub_graph = graphs_by_length[total_zeros - zeros_counts]
+                graph |= prefix_graph + suffix + ZERO_POW[zeros_counts] + insert_space + sub_graph
+            return graph
+
+        # Tiers of three or more digits are referenced from the larger tiers through non-terminals
+        # and only substituted once by pynini.replace, instead of being copied into each of them
+        tiers = {}
+        graphs_by_length = {1: digit, 2: teens_ties}
+
+        def add_tier(length, graph):
+            tiers[length] = graph
+            graphs_by_length[length] = pynini.accep(f"[{TIER_NONTERMINAL}{length}]")
 
         # Hundred graph
         suffix_hundreds = pynutil.insert(" শত")
-        graph_hundreds = create_graph_suffix(digit, suffix_hundreds, 2)
-        graph_hundreds |= create_larger_number_graph(digit, suffix_hundreds, 1, digit)
-        graph_hundreds |= create_larger_number_graph(digit, suffix_hundreds, 0, teens_ties)
-        graph_hundreds.optimize()
-        self.graph_hundreds = graph_hundreds
-
-        # Transducer for eleven hundred -> 1100 or twenty one hundred eleven -> 2111
-        graph_hundreds_as_thousand = create_graph_suffix(teens_and_ties, suffix_hundreds, 2)
-        graph_hundreds_as_thousand |= create_larger_number_graph(teens_and_ties, suffix_hundreds, 1, digit)
-        graph_hundreds_as_thousand |= create_larger_number_graph(teens_and_ties, suffix_hundreds, 0, teens_ties)
-        self.graph_hundreds_as_thousand = graph_hundreds_as_thousand
-
-        # Thousands and Ten thousands graph
-        suffix_thousands = pynutil.insert(" হাজার")
-        graph_thousands = create_graph_suffix(digit, suffix_thousands, 3)
-        graph_thousands |= create_larger_number_graph(digit, suffix_thousands, 2, digit)
-        graph_thousands |= create_larger_number_graph(digit, suffix_thousands, 1, teens_ties)
-        graph_thousands |= create_larger_number_graph(digit, suffix_thousands, 0, graph_hundreds)
-        graph_thousands.optimize()
-        self.graph_thousands = graph_thousands
-
-        graph_ten_thousands = create_graph_suffix(teens_and_ties, suffix_thousands, 3)
-        graph_ten_thousands |= create_larger_number_graph(teens_and_ties, suffix_thousands, 2, digit)
-        graph_ten_thousands |= create_larger_number_graph(teens_and_ties, suffix_thousands, 1, teens_ties)
-        graph_ten_thousands |= create_larger_number_graph(teens_and_ties, suffix_thousands, 0, graph_hundreds)
-        graph_ten_thousands.optimize()
-        self.graph_ten_thousands = graph_ten_thousands
-
-        # Lakhs graph and ten lakhs graph
-        suffix_lakhs = pynutil.insert(" লক্ষ")
-        graph_lakhs = create_graph_suffix(digit, suffix_lakhs, 5)
-        graph_lakhs |= create_larger_number_graph(digit, suffix_lakhs, 4, digit)
-        graph_lakhs |= create_larger_number_graph(digit, suffix_lakhs, 3, teens_ties)
-        graph_lakhs |= create_larger_number_graph(digit, suffix_lakhs, 2, graph_hundreds)
-        graph_lakhs |= create_larger_number_graph(digit, suffix_lakhs, 1, graph_thousands)
-        graph_lakhs |= create_larger_number_graph(digit, suffix_lakhs, 0, graph_ten_thousands)
-        graph_lakhs.optimize()
-        self.graph_lakhs = graph_lakhs
-
-        graph_ten_lakhs = create_graph_suffix(teens_and_ties, suffix_lakhs, 5)
-        graph_ten_lakhs |= create_larger_number_graph(teens_and_ties, suffix_lakhs, 4, digit)
-        graph_ten_lakhs |= create_larger_number_graph(teens_and_ties, suffix_lakhs, 3, teens_ties)
-        graph_ten_lakhs |= create_larger_number_graph(teens_and_ties, suffix_lakhs, 2, graph_hundreds)
-        graph_ten_lakhs |= create_larger_number_graph(teens_and_ties, suffix_lakhs, 1, graph_thousands)
-        graph_ten_lakhs |= create_larger_number_graph(teens_and_ties, suffix_lakhs, 0, graph_ten_thousands)
-        graph_ten_lakhs.optimize()
-        self.graph_ten_lakhs = graph_ten_lakhs
-
-        # Crores graph ten crores graph
-        suffix_crores = pynutil.insert(" কোটি")
-        graph_crores = create_graph_suffix(digit, suffix_crores, 7)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 6, digit)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 5, teens_ties)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 4, graph_hundreds)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 3, graph_thousands)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 2, graph_ten_thousands)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 1, graph_lakhs)
-        graph_crores |= create_larger_number_graph(digit, suffix_crores, 0, graph_ten_lakhs)
-        graph_crores.optimize()
-
-        graph_ten_crores = create_graph_suffix(teens_and_ties, suffix_crores, 7)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 6, digit)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 5, teens_ties)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 4, graph_hundreds)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 3, graph_thousands)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 2, graph_ten_thousands)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 1, graph_lakhs)
-        graph_ten_crores |= create_larger_number_graph(teens_and_ties, suffix_crores, 0, graph_ten_lakhs)
-        graph_ten_crores.optimize()
+        add_tier(3, build_tier(digit, suffix_hundreds, 2, graphs_by_length))
+
+        # Thousands and lakhs graphs, each with its ten thousands and ten lakhs counterpart
+        for suffix, total_zeros in MAGNITUDE_TIERS[:-1]:
+            suffix_graph = pynutil.insert(suffix)
+            add_tier(total_zeros + 1, build_tier(digit, suffix_graph, total_zeros, graphs_by_length))
+            add_tier(total_zeros + 2, build_tier(teens_and_ties, suffix_graph, total_zeros, graphs_by_length))
+
+        # Crores and ten crores are not the remainder of any other tier, so they are built as one tier
+        # over a single lookup of all one and two digit prefixes
+        one_or_two_digits = (digit | teens_and_ties).optimize()
+        suffix, total_zeros = MAGNITUDE_TIERS[-1]
+        graph_crores = build_tier(one_or_two_digits, pynutil.insert(suffix), total_zeros, graphs_by_length)
 
         # Only match exactly 2 digits to avoid interfering with telephone numbers, decimals, etc.
         single_digit = digit | zero
         graph_leading_zero = zero + insert_space + single_digit
         graph_leading_zero = pynutil.add_weight(graph_leading_zero, 0.5)
 
-        # Combine all number patterns efficiently
-        # Support both Bengali digits and Arabic digits
+        # Combine all number patterns, the tiers above are left unoptimized
+        # since only the combined graph is composed with the digit inputs
         bengali_final_graph = (
             digit
             | zero
             | teens_and_ties
-            | graph_hundreds
-            | graph_thousands
-            | graph_ten_thousands
-            | graph_lakhs
-            | graph_ten_lakhs
+            | pynini.union(*[graphs_by_length[length] for length in sorted(tiers)])
             | graph_crores
-            | graph_ten_crores
             | graph_leading_zero
-        ).optimize()
+        )
+        if not self.deterministic:
+            # Transducer for eleven hundred -> 1100 or twenty one hundred eleven -> 2111
+            graph_hundreds_as_thousand = build_tier(teens_and_ties, suffix_hundreds, 2, graphs_by_length)
+            bengali_final_graph |= graph_hundreds_as_thousand
+
+        # Substitute the tier non-terminals, compiling the bracketed labels registers them as generated symbols
+        pynini.accep(f"[{TIER_NONTERMINAL}ROOT]")
+        symbols = pynini.generated_symbols()
+        pairs = [(symbols.find(f"{TIER_NONTERMINAL}ROOT"), bengali_final_graph)]
+        pairs += [(symbols.find(f"{TIER_NONTERMINAL}{length}"), tiers[length]) for length in tiers]
+        bengali_final_graph = pynini.replace(pairs, call_arc_labeling="neither", return_arc_labeling="neither")
+        # Sorted on input labels for the compositions with the digit inputs below
+        bengali_final_graph = bengali_final_graph.optimize().arcsort("ilabel")
 
         # Bengali digits: Use the full cardinal graph
         # Support up to 9 digits (up to 99 crore) - telephone has specific patterns that won't conflict
-        bengali_digit_input = pynini.closure(NEMO_BN_DIGIT, 1, 9)  # 1-9 digits
-        bengali_cardinal_graph = pynini.compose(bengali_digit_input, bengali_final_graph).optimize()
+        bengali_digit_input = pynini.closure(NEMO_BN_DIGIT, 1, 9).arcsort("olabel")  # 1-9 digits
+        bengali_cardinal_graph = pynini.compose(bengali_digit_input, bengali_final_graph)
 
         # Arabic digits: Convert to Bengali and verbalize using the full graph
         # Support up to 9 digits (up to 99 crore)
-        arabic_digit_input = pynini.closure(NEMO_DIGIT, 1, 9)  # 1-9 digits
-        arabic_final_graph = pynini.compose(arabic_digit_input, arabic_to_bengali_number @ bengali_final_graph).optimize()
-
-        # Handle comma-separated numbers (e.g., 1,234,567)
-        # These can be any length because commas indicate it's NOT a phone number
-        # IMPORTANT: Must match at least ONE comma to avoid matching single digits
-        
-        # Delete commas pattern for Arabic - REQUIRES at least one comma
-        delete_commas_arabic = (
-            pynini.closure(NEMO_DIGIT, 1)  # One or more digits
-            + pynutil.delete(",")  # MUST have at least one comma
-            + pynini.closure(pynini.closure(NEMO_DIGIT, 1) + pynini.closure(pynutil.delete(","), 0, 1))  # More digit groups
-        ).optimize()
-        
-        # Delete commas pattern for Bengali - REQUIRES at least one comma
-        delete_commas_bengali = (
-            pynini.closure(NEMO_BN_DIGIT, 1)  # One or more digits
-            + pynutil.delete(",")  # MUST have at least one comma
-            + pynini.closure(pynini.closure(NEMO_BN_DIGIT, 1) + pynini.closure(pynutil.delete(","), 0, 1))  # More digit groups
-        ).optimize()
-        
-        # Add comma support: compose delete_commas with final graphs
-        # For Bengali digits with commas
-        bengali_with_commas = pynini.compose(delete_commas_bengali, bengali_final_graph).optimize()
-        
-        # For Arabic digits with commas: delete commas, convert to Bengali, then process
-        arabic_with_commas = pynini.compose(
-            delete_commas_arabic,
-            arabic_to_bengali_number @ bengali_final_graph
-        ).optimize()
-        
-        # Give comma-separated numbers higher priority (lower weight)
-        bengali_final_with_commas = pynutil.add_weight(bengali_with_commas, -0.1) | bengali_cardinal_graph
-        arabic_final_with_commas = pynutil.add_weight(arabic_with_commas, -0.1) | arabic_final_graph
-
-        # Combine both Bengali and Arabic digit paths (both with comma support)
-        final_graph = bengali_final_with_commas | arabic_final_with_commas
+        arabic_digit_input = pynini.closure(NEMO_DIGIT, 1, 9).arcsort("olabel")  # 1-9 digits
+        arabic_final_graph = pynini.compose(arabic_digit_input, arabic_to_bengali_number @ bengali_final_graph)
 
-        optional_minus_graph = pynini.closure(pynutil.insert("negative: ") + pynini.cross("-", "\"true\" "), 0, 1)
+        # Comma separated numbers (e.g., 1,234,567) are handled by the Normalizer, which removes
+        # commas between digits before tagging
+        final_graph = bengali_cardinal_graph | arabic_final_graph
+
+        return {
+            "final_graph": final_graph.optimize(),
+        }
 
-        self.final_graph = final_graph.optimize()
-        final_graph = optional_minus_graph + pynutil.insert("integer: \"") + self.final_graph + pynutil.insert("\"")
-        final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph
 
+@functools.lru_cache(maxsize=None)
+def _number_words() -> Dict[str, str]:
+    """
+    Returns the readings of all numbers below hundred keyed by their Bengali digits
+    """
+    words = {}
+    for name in ("digit", "zero", "teens_and_ties"):
+        for row in load_labels(get_abs_path(f"data/numbers/{name}.tsv")):
+            if len(row) >= 2:
+                words.setdefault(row[0], row[1])
+    return words
+
+
+_cardinal_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_cardinal_fst(deterministic: bool, lm: bool) -> CardinalFst:
+    return CardinalFst(deterministic=deterministic, lm=lm)
+
+
+def get_cardinal_fst(deterministic: bool = True, lm: bool = False) -> CardinalFst:
+    """
+    Returns a CardinalFst shared within the process, the graphs are never modified after construction.
+
+    Args:
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+        lm: passed through to CardinalFst
+    """
+    # pynini graph construction is not reentrant, so only one thread builds at a time
+    with _cardinal_lock:
+        return _cached_cardinal_fst(deterministic, lm)
@@ -22,13 +22,11 @@ from indic_text_normalization.bn.graph_utils import (
     insert_space,
 )
 from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 
 # Convert Arabic digits (0-9) to Bengali digits (০-৯)
-arabic_to_bengali_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_bengali_number = pynini.closure(arabic_to_bengali_digit).optimize()
+arabic_to_bengali_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_bengali_number = arabic_to_native_number(BENGALI_DIGITS)
 
 days = pynini.string_file(get_abs_path("data/date/days.tsv"))
 months = pynini.string_file(get_abs_path("data/date/months.tsv"))
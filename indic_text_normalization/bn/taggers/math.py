@@ -12,27 +12,32 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import threading
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization import token_fields
 from indic_text_normalization.bn.graph_utils import (
     NEMO_DIGIT,
     NEMO_BN_DIGIT,
     NEMO_SPACE,
     GraphFst,
+    get_cache_key,
     insert_space,
 )
 from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build, load_string_file
+from indic_text_normalization.token_fields import concat, field
 
 # Convert Arabic digits (0-9) to Bengali digits (০-৯)
-arabic_to_bengali_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_bengali_number = pynini.closure(arabic_to_bengali_digit).optimize()
+arabic_to_bengali_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_bengali_number = arabic_to_native_number(BENGALI_DIGITS)
 
 # Load math operations
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
 
 class MathFst(GraphFst):
@@ -51,15 +56,25 @@ class MathFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="math", kind="classify", deterministic=deterministic)
 
+        cache_key = get_cache_key(
+            [__file__, token_fields.__file__, get_abs_path("data/math_operations.tsv")], cardinal.cache_key
+        )
+        far_file = os.path.join(CACHE_DIR, f"bn_math_{cache_key}.far")
+        self.fst = load_or_build(far_file, lambda: {"math": self._build_graph(cardinal)})["math"]
+
+    def _build_graph(self, cardinal: GraphFst):
+        """
+        Builds the math graph from the cardinal graph
+        """
         cardinal_graph = cardinal.final_graph
         
         # Support both Bengali and Arabic digits
         # Bengali digits input
-        bengali_number_input = pynini.closure(NEMO_BN_DIGIT, 1)
+        bengali_number_input = pynini.closure(NEMO_BN_DIGIT, 1).arcsort("olabel")
         bengali_number_graph = pynini.compose(bengali_number_input, cardinal_graph).optimize()
         
         # Arabic digits input
-        arabic_number_input = pynini.closure(NEMO_DIGIT, 1)
+        arabic_number_input = pynini.closure(NEMO_DIGIT, 1).arcsort("olabel")
         arabic_number_graph = pynini.compose(
             arabic_number_input,
             arabic_to_bengali_number @ cardinal_graph
@@ -68,153 +83,84 @@ class MathFst(GraphFst):
         # Combined number graph
         number_graph = bengali_number_graph | arabic_number_graph
 
-        # Optional space around operators
-        optional_space = pynini.closure(NEMO_SPACE, 0, 1)
-        delimiter = optional_space | pynutil.insert(" ")
+        # Space around operators, kept if present and inserted otherwise so that each input has a single path
+        delimiter = NEMO_SPACE | insert_space
 
         # Operators that can appear between numbers
         # Exclude : and / to avoid conflicts with time and dates
-        operators = pynini.union("+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?")
+        operators = pynini.union("+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?").optimize().arcsort("olabel")
+        # Verbalized operators, shared by all the patterns below
+        op_fst = (operators @ math_operations).optimize().arcsort("ilabel")
         
         # Math expression: number operator number
         # Pattern: number [space] operator [space] number
-        math_expression = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\"")
+        math_expression = concat(
+            field("left", number_graph),
+            delimiter,
+            field("operator", op_fst),
+            delimiter,
+            field("right", number_graph),
         )
 
         # Also support: number operator number operator number (for longer expressions)
         # This handles cases like "1+2+3" or "10 - 7 = 3"
-        extended_math = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("middle: \"")
-            + number_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator_two: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\"")
+        extended_math = concat(
+            field("left", number_graph),
+            delimiter,
+            field("operator", op_fst),
+            delimiter,
+            field("middle", number_graph),
+            delimiter,
+            field("operator_two", op_fst),
+            delimiter,
+            field("right", number_graph),
         )
 
         # Support: operator number (e.g., "+5", "*3")
-        operator_number = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\"")
-        )
+        operator_number = concat(field("left"), field("operator", op_fst), delimiter, field("right", number_graph))
 
         # Support: number operator (e.g., "5+", "3*")
-        number_operator = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-        )
+        number_operator = concat(field("left", number_graph), delimiter, field("operator", op_fst), field("right"))
 
         # Support: standalone operator (e.g., "+", "*", "?")
-        standalone_operator = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-        )
+        standalone_operator = concat(field("left"), field("operator", op_fst), field("right"))
 
         # Operands (for tight patterns)
         operand_graph = number_graph
 
-        # Special-case: tight dash patterns (no space) - need insert_space for parser compatibility
+        # Special-case: tight dash patterns (no space) - need an inserted space for parser compatibility
         # Pattern 1: "10-2=8" should be treated as "থেকে" (from) - tight minus with equals
-        math_expression_tight_minus_equals = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "থেকে")
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("middle: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "সমান")
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        math_expression_tight_minus_equals = concat(
+            field("left", operand_graph),
+            " ",
+            field("operator", pynini.cross("-", "থেকে")),
+            " ",
+            field("middle", operand_graph),
+            " ",
+            field("operator_two", pynini.cross("=", "সমান")),
+            " ",
+            field("right", operand_graph),
         )
 
         # Pattern 2: "10-2 text" should also be treated as "থেকে" (from) - tight minus without equals
         # This matches number-number (no spaces around "-") and outputs a math token for just the pair.
-        math_expression_tight_minus_text = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "থেকে")
-            + pynutil.insert("\"")
-            + insert_space
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        math_expression_tight_minus_text = concat(
+            field("left", operand_graph),
+            " ",
+            field("operator", pynini.cross("-", "থেকে")),
+            " ",
+            field("right", operand_graph),
         )
 
         # Root expressions: √2, √3, etc. (square root)
         # Support both with and without space: "√2" or "√ 2"
         sqrt_symbol = pynini.accep("√")
         optional_space_after_sqrt = pynini.closure(NEMO_SPACE, 0, 1)
-        sqrt_expression = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + pynini.cross(sqrt_symbol, "বর্গমূল")
-            + pynutil.insert("\"")
-            + optional_space_after_sqrt
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\"")
+        sqrt_expression = concat(
+            field("left"),
+            field("operator", pynini.cross(sqrt_symbol, "বর্গমূল")),
+            optional_space_after_sqrt,
+            field("right", number_graph),
         )
 
         final_graph = (
@@ -228,4 +174,26 @@ class MathFst(GraphFst):
             | standalone_operator
         )
         final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph.optimize()
+        return final_graph.optimize()
+
+
+_math_lock = threading.Lock()
+
+
+def get_math_fst(cardinal: GraphFst, deterministic: bool = True) -> MathFst:
+    """
+    Returns a MathFst shared within the process for the given cardinal instance.
+    The MathFst is kept on the cardinal, so that it is released together with it.
+
+    Args:
+        cardinal: cardinal GraphFst, e.g. from get_cardinal_fst()
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+    """
+    with _math_lock:
+        math_fsts = getattr(cardinal, "_math_fsts", None)
+        if math_fsts is None:
+            math_fsts = cardinal._math_fsts = {}
+        if deterministic not in math_fsts:
+            math_fsts[deterministic] = MathFst(cardinal=cardinal, deterministic=deterministic)
+        return math_fsts[deterministic]
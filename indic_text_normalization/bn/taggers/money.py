@@ -22,15 +22,13 @@ from indic_text_normalization.bn.graph_utils import (
     insert_space,
 )
 from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 
 currency_graph = pynini.string_file(get_abs_path("data/money/currency.tsv"))
 
 # Convert Arabic digits (0-9) to Bengali digits (০-৯)
-arabic_to_bengali_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_bengali_number = pynini.closure(arabic_to_bengali_digit).optimize()
+arabic_to_bengali_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_bengali_number = arabic_to_native_number(BENGALI_DIGITS)
 
 # Bengali suffixes that can follow money amounts
 bengali_suffixes = pynini.union("তে", "কে", "র").optimize()
@@ -77,7 +75,7 @@ class MoneyFst(GraphFst):
         integer = pynutil.insert('integer_part: "') + number_cardinal + pynutil.insert('"')
         fraction = pynutil.insert('fractional_part: "') + number_cardinal + pynutil.insert('"')
         # Use "centiles" placeholder for verbalizer to apply appropriate minor currency denomination
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         # Optional Bengali suffixes after money amount
         optional_suffix = pynini.closure(pynutil.delete(bengali_suffixes), 0, 1)
@@ -16,6 +16,7 @@ import pynini
 from pynini.lib import pynutil
 
 from indic_text_normalization.bn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_BN_DIGIT, insert_space
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 
 
 class ScientificFst(GraphFst):
@@ -37,21 +38,8 @@ class ScientificFst(GraphFst):
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
 
         # Arabic digits -> Bengali digits
-        arabic_to_bn_digit = pynini.string_map(
-            [
-                ("0", "০"),
-                ("1", "১"),
-                ("2", "২"),
-                ("3", "৩"),
-                ("4", "৪"),
-                ("5", "৫"),
-                ("6", "৬"),
-                ("7", "৭"),
-                ("8", "৮"),
-                ("9", "৯"),
-            ]
-        ).optimize()
-        arabic_to_bn_number = pynini.closure(arabic_to_bn_digit).optimize()
+        arabic_to_bn_digit = arabic_to_native_digit(BENGALI_DIGITS)
+        arabic_to_bn_number = arabic_to_native_number(BENGALI_DIGITS)
 
         # Integer part for mantissa
         bn_int = pynini.compose(pynini.closure(NEMO_BN_DIGIT, 1), cardinal_graph).optimize()
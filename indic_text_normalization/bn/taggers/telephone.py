@@ -17,13 +17,11 @@ from pynini.lib import pynutil
 
 from indic_text_normalization.bn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_BN_DIGIT, insert_space
 from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 
 # Convert Arabic digits (0-9) to Bengali digits (০-৯)
-arabic_to_bengali_digit = pynini.string_map([
-    ("0", "০"), ("1", "১"), ("2", "২"), ("3", "৩"), ("4", "৪"),
-    ("5", "৫"), ("6", "৬"), ("7", "৭"), ("8", "৮"), ("9", "৯")
-]).optimize()
-arabic_to_bengali_number = pynini.closure(arabic_to_bengali_digit).optimize()
+arabic_to_bengali_digit = arabic_to_native_digit(BENGALI_DIGITS)
+arabic_to_bengali_number = arabic_to_native_number(BENGALI_DIGITS)
 
 digit = pynini.string_file(get_abs_path("data/numbers/digit.tsv"))
 zero = pynini.string_file(get_abs_path("data/numbers/zero.tsv"))
@@ -33,6 +31,8 @@ class TelephoneFst(GraphFst):
     """
     Finite state transducer for classifying telephone numbers, e.g.
         "৯৮৭৬৫৪৩২১০" -> telephone { number_part: "নয় আট সাত ছয় পাঁচ চার তিন দুই এক শূন্য" }
+        "+৯৮৭৬৫৪৩২১০" -> telephone { country_code: "প্লাস" number_part: "নয় আট সাত ছয় পাঁচ চার তিন দুই এক শূন্য" }
+        "০০৭" -> telephone { number_part: "শূন্য শূন্য সাত" }
 
     Args:
         deterministic: if True will provide a single transduction option,
@@ -58,7 +58,13 @@ class TelephoneFst(GraphFst):
             arabic_to_bengali_number @ pynini.closure(digit_graph + insert_space, min_digits)
         ).optimize()
 
-        number_graph = bengali_path | arabic_path
+        # Bengali digit groups joined by hyphens, e.g. ৯৮৭৬-৫৪৩২১০, read as one number
+        bengali_groups = pynini.closure(NEMO_BN_DIGIT, 1) + pynini.closure(
+            pynutil.delete("-") + pynini.closure(NEMO_BN_DIGIT, 1), 1
+        )
+        bengali_hyphenated_path = pynini.compose(bengali_groups, bengali_path).optimize()
+
+        number_graph = bengali_path | arabic_path | bengali_hyphenated_path
 
         # Handle country code with + sign (e.g., +91)
         # Convert + to Bengali "প্লাস"
@@ -81,7 +87,24 @@ class TelephoneFst(GraphFst):
         # Phone number without country code
         phone_without_country = pynutil.insert("number_part: \"") + number_graph + pynutil.insert("\"")
 
-        graph = phone_with_country | phone_without_country
+        # Bengali digit number after a bare + sign, e.g. +৯৮৭৬৫৪৩২১০
+        phone_with_plus = (
+            pynutil.insert("country_code: \"")
+            + plus_sign
+            + pynutil.insert("\" ")
+            + pynutil.insert("number_part: \"")
+            + (bengali_path | bengali_hyphenated_path)
+            + pynutil.insert("\"")
+        )
+
+        # Bengali digit codes with leading zeros, e.g. ০০৭, are read digit by digit
+        leading_zero_path = pynini.compose(
+            pynini.accep("০") + pynini.closure(NEMO_BN_DIGIT, 1),
+            pynini.closure(digit_graph + insert_space, 2),
+        )
+        leading_zero_code = pynutil.insert("number_part: \"") + leading_zero_path + pynutil.insert("\"")
+
+        graph = phone_with_country | phone_without_country | phone_with_plus | leading_zero_code
 
         final_graph = self.add_tokens(graph)
         self.fst = final_graph.optimize()
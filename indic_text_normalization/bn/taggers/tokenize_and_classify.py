@@ -12,9 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import contextlib
+import functools
 import logging
 import os
 import time
+from glob import glob
+from typing import Dict, Tuple
 
 import pynini
 from pynini.lib import pynutil
@@ -30,9 +34,9 @@ from indic_text_normalization.bn.graph_utils import (
     GraphFst,
     delete_extra_space,
     delete_space,
-    generator_main,
+    get_cache_key,
 )
-from indic_text_normalization.bn.taggers.cardinal import CardinalFst
+from indic_text_normalization.bn.taggers.cardinal import get_cardinal_fst
 from indic_text_normalization.bn.taggers.date import DateFst
 from indic_text_normalization.bn.taggers.decimal import DecimalFst
 from indic_text_normalization.bn.taggers.fraction import FractionFst
@@ -48,6 +52,186 @@ from indic_text_normalization.bn.taggers.scientific import ScientificFst
 
 
 from indic_text_normalization.bn.taggers.serial import SerialFst
+from indic_text_normalization.bn.utils import get_abs_path
+from indic_text_normalization.graph_build import build_graphs
+from indic_text_normalization.graph_cache import save_far
+
+# Grammars compiled at package build time by indic_text_normalization.bn.precompile
+PREBUILT_DIR = get_abs_path("data/prebuilt")
+
+# Bengali script block, without the Bengali digits so that digit runs are not split. In byte mode the
+# optimized union is a trie over the UTF-8 bytes (E0, then A6 or A7, then the last byte), and the sets
+# are sorted on input labels for the matchers of the cdrewrite compositions.
+_BN_BLOCK_CHARS = "".join(map(chr, range(0x0980, 0x0A00)))
+_BN_BLOCK = pynini.difference(pynini.union(*_BN_BLOCK_CHARS), NEMO_BN_DIGIT)
+_BN_BLOCK = _BN_BLOCK.optimize().arcsort("ilabel")
+# Characters that are part of numbers
+_ALL_DIGITS = pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT).optimize().arcsort("ilabel")
+_NON_DIGIT = pynini.difference(NEMO_NOT_SPACE, _ALL_DIGITS).optimize().arcsort("ilabel")
+_MATH_SYMBOLS = pynini.union("√", "∑", "∏", "∫", "∬", "∭", "∮", "∂", "∇").optimize().arcsort("ilabel")
+# Characters separated from a preceding math symbol
+_FOLLOWING = pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT, NEMO_ALPHA).optimize().arcsort("ilabel")
+
+# Taggers built only from the cardinal graph (and the serial one from the shared ordinal), so they can be
+# built independently of each other
+CARDINAL_TAGGERS = {
+    "ordinal": lambda cardinal, deterministic: _get_ordinal_fst(deterministic=deterministic),
+    "decimal": lambda cardinal, deterministic: DecimalFst(cardinal=cardinal, deterministic=deterministic),
+    "fraction": lambda cardinal, deterministic: FractionFst(cardinal=cardinal, deterministic=deterministic),
+    "date": lambda cardinal, deterministic: DateFst(cardinal=cardinal),
+    "time": lambda cardinal, deterministic: TimeFst(cardinal=cardinal),
+    "money": lambda cardinal, deterministic: MoneyFst(cardinal=cardinal),
+    "math": lambda cardinal, deterministic: _get_math_fst(cardinal=cardinal, deterministic=deterministic),
+    "power": lambda cardinal, deterministic: PowerFst(cardinal=cardinal, deterministic=deterministic),
+    "scientific": lambda cardinal, deterministic: ScientificFst(cardinal=cardinal, deterministic=deterministic),
+    "serial": lambda cardinal, deterministic: SerialFst(
+        cardinal=cardinal, ordinal=_get_ordinal_fst(deterministic=deterministic), deterministic=deterministic
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _get_ordinal_fst(deterministic: bool) -> GraphFst:
+    return OrdinalFst(cardinal=get_cardinal_fst(deterministic=deterministic), deterministic=deterministic)
+
+
+def _get_math_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.bn.taggers.math import get_math_fst
+
+    return get_math_fst(cardinal=cardinal, deterministic=deterministic)
+
+
+@contextlib.contextmanager
+def _timed(name: str, get_graph=None):
+    """
+    Logs the build time of the enclosed block and the number of states of its graph at debug level.
+    The graph is only looked up, and its states counted, when debug logging is enabled.
+
+    Args:
+        name: name of the graph in the log message
+        get_graph: optional callable returning the graph built in the block
+    """
+    start_time = time.time()
+    yield
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        if get_graph is None:
+            logging.debug(f"{name}: {time.time() - start_time:.2f}s")
+        else:
+            logging.debug(f"{name}: {time.time() - start_time:.2f}s -- {get_graph().num_states()} nodes")
+
+
+# Graphs of CARDINAL_TAGGERS by tagger name and deterministic, never modified after construction
+_tagger_graphs: Dict[Tuple[str, bool], 'pynini.FstLike'] = {}
+
+
+def _build_tagger_graph(name: str, deterministic: bool):
+    """
+    Builds the graph of one of CARDINAL_TAGGERS
+    """
+    return CARDINAL_TAGGERS[name](get_cardinal_fst(deterministic=deterministic), deterministic).fst
+
+
+def _build_cardinal_tagger_graphs(deterministic: bool):
+    """
+    Builds the graphs of all CARDINAL_TAGGERS, in forked worker processes if enabled by build_workers.
+    The cardinal and ordinal graphs are built first so that the workers inherit them instead of building them again.
+
+    Args:
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+
+    Returns: mapping of tagger name to its graph, shared within the process
+    """
+    # the graphs do not depend on the input case, so ClassifyFst grammars of both input cases share them
+    names = [name for name in CARDINAL_TAGGERS if (name, deterministic) not in _tagger_graphs]
+    if names:
+        get_cardinal_fst(deterministic=deterministic)
+        _get_ordinal_fst(deterministic=deterministic)
+        graphs = build_graphs(functools.partial(_build_tagger_graph, deterministic=deterministic), names)
+        for name, graph in graphs.items():
+            _tagger_graphs[(name, deterministic)] = graph
+    return {name: _tagger_graphs[(name, deterministic)] for name in CARDINAL_TAGGERS}
+
+
+@functools.lru_cache(maxsize=1)
+def _build_preprocess_fst():
+    """
+    Builds the spacing rewrites applied to the input before tagging, composed into a single graph.
+    They do not depend on any ClassifyFst argument, so they are built once per process.
+    """
+    # Rewrite joiner hyphens between digits and Bengali letters to spaces.
+    # Example: "3.14-সেখানে" -> "3.14 সেখানে"
+    joiner_hyphen_to_space = pynini.cdrewrite(pynini.cross("-", " "), _ALL_DIGITS, _BN_BLOCK, NEMO_SIGMA)
+
+    # Convert underscore between digits and Bengali letters to space.
+    # Example: "3.14_সেখানে" -> "3.14 সেখানে"
+    underscore_to_space = pynini.cdrewrite(pynini.cross("_", " "), _ALL_DIGITS, _BN_BLOCK, NEMO_SIGMA)
+
+    # Insert space when digits are directly followed by Bengali letters (no separator)
+    # Example: "3.14159265358979সেখানে" -> "3.14159265358979 সেখানে"
+    digit_indic_insert_space = pynini.cdrewrite(pynutil.insert(" "), _ALL_DIGITS, _BN_BLOCK, NEMO_SIGMA)
+
+    # Also ensure glued equals patterns like "π=3.1415" tokenize cleanly.
+    # Only apply when the left side is NOT a digit (so we don't change "10-2=8" tight math behavior).
+    equals_to_spaced = pynini.cdrewrite(pynini.cross("=", " = "), _NON_DIGIT, _ALL_DIGITS, NEMO_SIGMA)
+
+    # Also separate em-dash glued to a following number, e.g. "—3.14" so decimals can match.
+    emdash_to_spaced = pynini.cdrewrite(pynini.cross("—", "— "), "", _ALL_DIGITS, NEMO_SIGMA)
+
+    # And convert em-dash used as a joiner between digits and Bengali letters into a space:
+    #   "3.14—আরু" -> "3.14 আরু"
+    emdash_joiner_to_space = pynini.cdrewrite(pynini.cross("—", " "), _ALL_DIGITS, _BN_BLOCK, NEMO_SIGMA)
+
+    # Insert space between mathematical symbols (√, ∑, ∫, etc.) and following digits/letters
+    # Example: "√2" -> "√ 2", "∑x" -> "∑ x"
+    math_symbol_to_spaced = pynini.cdrewrite(pynutil.insert(" "), _MATH_SYMBOLS, _FOLLOWING, NEMO_SIGMA)
+
+    # Apply preprocessing in order: direct digit-letter attachment first, then specific separators.
+    # optimize() already determinizes and minimizes the fused rules as an encoded acceptor; a transducer
+    # determinization does not terminate here, since the right context insertions are not sequential.
+    preprocess = (
+        math_symbol_to_spaced
+        @ digit_indic_insert_space
+        @ underscore_to_space
+        @ emdash_joiner_to_space
+        @ emdash_to_spaced
+        @ equals_to_spaced
+        @ joiner_hyphen_to_space
+    ).optimize()
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(f"preprocess: {preprocess.num_states()} nodes")
+    # Sorted on output labels as the left operand of the composition with the tagger graph
+    return preprocess.arcsort("olabel")
+
+
+@functools.lru_cache(maxsize=None)
+def _get_grammar_files() -> Tuple[str, ...]:
+    """
+    Returns the tagger modules and data files the ClassifyFst is built from, in a stable order.
+    """
+    taggers_dir = os.path.dirname(__file__)
+    return tuple(
+        sorted(glob(os.path.join(taggers_dir, "*.py")))
+        + [get_abs_path("utils.py")]
+        + sorted(glob(os.path.join(get_abs_path("data"), "**", "*.tsv"), recursive=True))
+    )
+
+
+def get_far_name(input_case: str, deterministic: bool = True, whitelist: str = None) -> str:
+    """
+    Returns the name of the FAR file of a ClassifyFst, keyed on the content of its grammar sources,
+    so that a prebuilt or cached FAR of other grammars is never loaded, and on the whitelist content
+    rather than its name, so that whitelists with the same name differ.
+
+    Args:
+        input_case: accepting either "lower_cased" or "cased" input.
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+        whitelist: path to a file with whitelist replacements
+    """
+    cache_key = get_cache_key(list(_get_grammar_files()) + ([whitelist] if whitelist else []))
+    return f"bn_tn_{deterministic}_deterministic_{input_case}_{cache_key}_tokenize.far"
+
 
 class ClassifyFst(GraphFst):
     def __init__(
@@ -60,112 +244,71 @@ class ClassifyFst(GraphFst):
     ):
         super().__init__(name="tokenize_and_classify", kind="classify", deterministic=deterministic)
 
+        far_name = get_far_name(input_case, deterministic, whitelist)
+        prebuilt_file = os.path.join(PREBUILT_DIR, far_name)
         far_file = None
         if cache_dir is not None and cache_dir != "None":
             os.makedirs(cache_dir, exist_ok=True)
-            whitelist_file = os.path.basename(whitelist) if whitelist else ""
-            far_file = os.path.join(
-                cache_dir,
-                f"bn_tn_{deterministic}_deterministic_{input_case}_{whitelist_file}_tokenize.far",
-            )
+            far_file = os.path.join(cache_dir, far_name)
         if not overwrite_cache and far_file and os.path.exists(far_file):
             self.fst = pynini.Far(far_file, mode="r")["tokenize_and_classify"]
             logging.info(f"ClassifyFst.fst was restored from {far_file}.")
+        elif not overwrite_cache and os.path.exists(prebuilt_file):
+            self.fst = pynini.Far(prebuilt_file, mode="r")["tokenize_and_classify"]
+            logging.info(f"ClassifyFst.fst was restored from {prebuilt_file}.")
         else:
             logging.info(f"Creating ClassifyFst grammars.")
 
-            start_time = time.time()
-            cardinal = CardinalFst(deterministic=deterministic)
-            cardinal_graph = cardinal.fst
-            logging.debug(f"cardinal: {time.time() - start_time:.2f}s -- {cardinal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            ordinal = OrdinalFst(cardinal=cardinal, deterministic=deterministic)
-            ordinal_graph = ordinal.fst
-            logging.debug(f"ordinal: {time.time() - start_time:.2f}s -- {ordinal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            decimal = DecimalFst(cardinal=cardinal, deterministic=deterministic)
-            decimal_graph = decimal.fst
-            logging.debug(f"decimal: {time.time() - start_time:.2f}s -- {decimal_graph.num_states()} nodes")
-
-            start_time = time.time()
-            fraction = FractionFst(cardinal=cardinal, deterministic=deterministic)
-            fraction_graph = fraction.fst
-            logging.debug(f"fraction: {time.time() - start_time:.2f}s -- {fraction_graph.num_states()} nodes")
-
-            start_time = time.time()
-            date = DateFst(cardinal=cardinal)
-            date_graph = date.fst
-            logging.debug(f"date: {time.time() - start_time:.2f}s -- {date_graph.num_states()} nodes")
-
-            start_time = time.time()
-            timefst = TimeFst(cardinal=cardinal)
-            time_graph = timefst.fst
-            logging.debug(f"time: {time.time() - start_time:.2f}s -- {time_graph.num_states()} nodes")
-
-            start_time = time.time()
-            money = MoneyFst(cardinal=cardinal)
-            money_graph = money.fst
-            logging.debug(f"money: {time.time() - start_time:.2f}s -- {money_graph.num_states()} nodes")
-
-            start_time = time.time()
-            from indic_text_normalization.bn.taggers.math import MathFst
-            math = MathFst(cardinal=cardinal, deterministic=deterministic)
-            math_graph = math.fst
-            logging.debug(f"math: {time.time() - start_time:.2f}s -- {math_graph.num_states()} nodes")
-
-            start_time = time.time()
-            whitelist = WhiteListFst(
-                input_case=input_case, deterministic=deterministic, input_file=whitelist
-            )
-            whitelist_graph = whitelist.fst
-            logging.debug(f"whitelist: {time.time() - start_time:.2f}s -- {whitelist_graph.num_states()} nodes")
-
-            start_time = time.time()
-            punctuation = PunctuationFst(deterministic=deterministic)
-            punct_graph = punctuation.fst
-            logging.debug(f"punct: {time.time() - start_time:.2f}s -- {punct_graph.num_states()} nodes")
-
-            start_time = time.time()
-            telephone = TelephoneFst()
-            telephone_graph = telephone.fst
-            logging.debug(f"telephone: {time.time() - start_time:.2f}s -- {telephone_graph.num_states()} nodes")
-
-            start_time = time.time()
-            power = PowerFst(cardinal=cardinal, deterministic=deterministic)
-            power_graph = power.fst
-
-            scientific = ScientificFst(cardinal=cardinal, deterministic=deterministic)
-            scientific_graph = scientific.fst
-            logging.debug(f"power: {time.time() - start_time:.2f}s -- {power_graph.num_states()} nodes")
-
-            start_time = time.time()
-            serial = SerialFst(cardinal=cardinal, ordinal=ordinal, deterministic=deterministic)
-            serial_graph = serial.fst
-            logging.debug(f"serial: {time.time() - start_time:.2f}s -- {serial_graph.num_states()} nodes")
-
-            classify = (
-                pynutil.add_weight(whitelist_graph, 1.01)
-                | pynutil.add_weight(time_graph, 1.1)
-                | pynutil.add_weight(date_graph, 1.09)
-                | pynutil.add_weight(decimal_graph, 1.1)
-                | pynutil.add_weight(cardinal_graph, 1.1)
-                | pynutil.add_weight(ordinal_graph, 1.1)
-                | pynutil.add_weight(money_graph, 1.1)
-                | pynutil.add_weight(telephone_graph, 0.5)  # Higher priority than cardinal
-                | pynutil.add_weight(fraction_graph, 1.1)
-                | pynutil.add_weight(math_graph, 1.1)
-                | pynutil.add_weight(scientific_graph, 1.08)  # Higher priority for scientific notation
-                | pynutil.add_weight(power_graph, 1.09)  # Higher priority for superscripts
-                | pynutil.add_weight(serial_graph, 1.12)  # Serial numbers
-            )
-
-            start_time = time.time()
-            word_graph = WordFst(punctuation=punctuation, deterministic=deterministic).fst
-            logging.debug(f"word: {time.time() - start_time:.2f}s -- {word_graph.num_states()} nodes")
+            with _timed("cardinal", lambda: cardinal_graph):
+                cardinal = get_cardinal_fst(deterministic=deterministic)
+                cardinal_graph = cardinal.fst
+
+            with _timed("cardinal taggers"):
+                graphs = _build_cardinal_tagger_graphs(deterministic=deterministic)
+            ordinal_graph = graphs["ordinal"]
+            decimal_graph = graphs["decimal"]
+            fraction_graph = graphs["fraction"]
+            date_graph = graphs["date"]
+            time_graph = graphs["time"]
+            money_graph = graphs["money"]
+            math_graph = graphs["math"]
+            power_graph = graphs["power"]
+            scientific_graph = graphs["scientific"]
+            serial_graph = graphs["serial"]
+
+            with _timed("whitelist", lambda: whitelist_graph):
+                whitelist = WhiteListFst(
+                    input_case=input_case, deterministic=deterministic, input_file=whitelist
+                )
+                whitelist_graph = whitelist.fst
+
+            with _timed("punct", lambda: punct_graph):
+                punctuation = PunctuationFst(deterministic=deterministic)
+                punct_graph = punctuation.fst
+
+            with _timed("telephone", lambda: telephone_graph):
+                telephone = TelephoneFst()
+                telephone_graph = telephone.fst
+
+            weighted = [
+                pynutil.add_weight(whitelist_graph, 1.01),
+                pynutil.add_weight(time_graph, 1.1),
+                pynutil.add_weight(date_graph, 1.09),
+                pynutil.add_weight(decimal_graph, 1.1),
+                pynutil.add_weight(cardinal_graph, 1.1),
+                pynutil.add_weight(ordinal_graph, 1.1),
+                pynutil.add_weight(money_graph, 1.1),
+                pynutil.add_weight(telephone_graph, 0.5),  # Higher priority than cardinal
+                pynutil.add_weight(fraction_graph, 1.1),
+                pynutil.add_weight(math_graph, 1.1),
+                pynutil.add_weight(scientific_graph, 1.08),  # Higher priority for scientific notation
+                pynutil.add_weight(power_graph, 1.09),  # Higher priority for superscripts
+                pynutil.add_weight(serial_graph, 1.12),  # Serial numbers
+            ]
+
+            with _timed("word", lambda: word_graph):
+                word_graph = WordFst(punctuation=punctuation, deterministic=deterministic).fst
 
-            start_time = time.time()
             punct = pynutil.insert("tokens { ") + pynutil.add_weight(punct_graph, weight=2.1) + pynutil.insert(" }")
             punct = pynini.closure(
                 pynini.union(
@@ -175,7 +318,8 @@ class ClassifyFst(GraphFst):
                 1,
             )
 
-            classify = pynini.union(classify, pynutil.add_weight(word_graph, 100))
+            # A single n-ary union, rather than a chain of binary unions with their intermediate results
+            classify = pynini.union(*weighted, pynutil.add_weight(word_graph, 100))
             token = pynutil.insert("tokens { ") + classify + pynutil.insert(" }")
             token_plus_punct = (
                 pynini.closure(punct + pynutil.insert(NEMO_SPACE))
@@ -194,51 +338,10 @@ class ClassifyFst(GraphFst):
             graph = delete_space + graph + delete_space
             graph = pynini.union(graph, punct)
 
-            # Define Bengali script block
-            bn_block = pynini.union(*[chr(i) for i in range(0x0980, 0x0A00)]).optimize()  # Bengali block
-            
-            # Characters that are part of numbers
-            all_digits = pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT).optimize()
-            
-            # Rewrite joiner hyphens between digits and Bengali letters to spaces.
-            # Example: "3.14-সেখানে" -> "3.14 সেখানে"
-            joiner_hyphen_to_space = pynini.cdrewrite(pynini.cross("-", " "), all_digits, bn_block, NEMO_SIGMA)
-
-            # Convert underscore between digits and Bengali letters to space.
-            # Example: "3.14_সেখানে" -> "3.14 সেখানে"
-            underscore_to_space = pynini.cdrewrite(pynini.cross("_", " "), all_digits, bn_block, NEMO_SIGMA)
-            
-            # Insert space when digits are directly followed by Bengali letters (no separator)
-            # Example: "3.14159265358979সেখানে" -> "3.14159265358979 সেখানে"
-            digit_indic_insert_space = pynini.cdrewrite(pynutil.insert(" "), all_digits, bn_block, NEMO_SIGMA)
-
-            start_time = time.time()
-            # Also ensure glued equals patterns like "π=3.1415" tokenize cleanly.
-            # Only apply when the left side is NOT a digit (so we don't change "10-2=8" tight math behavior).
-            non_digit_left = pynini.difference(
-                NEMO_NOT_SPACE, pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT)
-            ).optimize()
-            digit_right = pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT).optimize()
-            equals_to_spaced = pynini.cdrewrite(pynini.cross("=", " = "), non_digit_left, digit_right, NEMO_SIGMA)
-
-            # Also separate em-dash glued to a following number, e.g. "—3.14" so decimals can match.
-            emdash_to_spaced = pynini.cdrewrite(pynini.cross("—", "— "), "", digit_right, NEMO_SIGMA)
-
-            # And convert em-dash used as a joiner between digits and Bengali letters into a space:
-            #   "3.14—আরু" -> "3.14 আরু"
-            emdash_joiner_to_space = pynini.cdrewrite(pynini.cross("—", " "), digit_right, bn_block, NEMO_SIGMA)
-
-            # Insert space between mathematical symbols (√, ∑, ∫, etc.) and following digits/letters
-            # Example: "√2" -> "√ 2", "∑x" -> "∑ x"
-            math_symbols = pynini.union("√", "∑", "∏", "∫", "∬", "∭", "∮", "∂", "∇").optimize()
-            following_char = pynini.union(NEMO_DIGIT, NEMO_BN_DIGIT, NEMO_ALPHA).optimize()
-            math_symbol_to_spaced = pynini.cdrewrite(pynutil.insert(" "), math_symbols, following_char, NEMO_SIGMA)
-
-            # Apply preprocessing in order: direct digit-letter attachment first, then specific separators
-            self.fst = (math_symbol_to_spaced @ digit_indic_insert_space @ underscore_to_space @ emdash_joiner_to_space @ emdash_to_spaced @ equals_to_spaced @ joiner_hyphen_to_space @ graph).optimize()
-            logging.debug(f"final graph optimization: {time.time() - start_time:.2f}s -- {self.fst.num_states()} nodes")
+            with _timed("final graph optimization", lambda: self.fst):
+                self.fst = (_build_preprocess_fst() @ graph).optimize()
 
             if far_file:
-                generator_main(far_file, {"tokenize_and_classify": self.fst})
+                save_far(far_file, {"tokenize_and_classify": self.fst})
                 logging.info(f"ClassifyFst grammars are saved to {far_file}.")
 
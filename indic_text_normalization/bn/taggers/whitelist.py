@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import os
+
 import pynini
 from pynini.lib import pynutil
 
@@ -29,6 +32,36 @@ from indic_text_normalization.bn.utils import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def _load_whitelist_graph(path: str, mtime: float, input_case: str, keep_punct_add_end: bool) -> 'pynini.FstLike':
+    whitelist = load_labels(path)
+    # Filter out empty rows or rows that don't have exactly 2 values
+    whitelist = [row for row in whitelist if len(row) >= 2]
+    if input_case == INPUT_LOWER_CASED:
+        whitelist = [[x.lower(), y] for x, y in whitelist]
+    else:
+        whitelist = [[x, y] for x, y in whitelist]
+
+    if keep_punct_add_end:
+        whitelist.extend(augment_labels_with_punct_at_end(whitelist))
+
+    return pynini.string_map(whitelist).optimize().arcsort("ilabel")
+
+
+def _get_whitelist_graph(input_case: str, file: str, keep_punct_add_end: bool = False) -> 'pynini.FstLike':
+    """
+    Returns the whitelist graph of a tsv file, compiled once per process and recompiled
+    only when the file is modified. The returned graph is shared, so callers must not modify it in place.
+
+    Args:
+        input_case: accepting either "lower_cased" or "cased" input.
+        file: path to a file with whitelist replacements
+        keep_punct_add_end: if True, also accepts the abbreviations with punctuation at the end
+    """
+    path = os.path.abspath(file)
+    return _load_whitelist_graph(path, os.path.getmtime(path), input_case, keep_punct_add_end)
+
+
 class WhiteListFst(GraphFst):
     """
     Finite state transducer for classifying whitelist, e.g.
@@ -45,22 +78,7 @@ class WhiteListFst(GraphFst):
     def __init__(self, input_case: str, deterministic: bool = True, input_file: str = None):
         super().__init__(name="whitelist", kind="classify", deterministic=deterministic)
 
-        def _get_whitelist_graph(input_case, file, keep_punct_add_end: bool = False):
-            whitelist = load_labels(file)
-            # Filter out empty rows or rows that don't have exactly 2 values
-            whitelist = [row for row in whitelist if len(row) >= 2]
-            if input_case == INPUT_LOWER_CASED:
-                whitelist = [[x.lower(), y] for x, y in whitelist]
-            else:
-                whitelist = [[x, y] for x, y in whitelist]
-
-            if keep_punct_add_end:
-                whitelist.extend(augment_labels_with_punct_at_end(whitelist))
-
-            graph = pynini.string_map(whitelist)
-            return graph
-
-        graph = _get_whitelist_graph(input_case, get_abs_path("data/whitelist/abbreviations.tsv"))
+        graph = _get_whitelist_graph(input_case, get_abs_path("data/whitelist/abbreviations.tsv")).copy()
         
         # Load symbols (like English implementation) - allow any character except "/"
         graph |= pynini.compose(
@@ -68,9 +86,7 @@ class WhiteListFst(GraphFst):
             _get_whitelist_graph(input_case, get_abs_path("data/whitelist/symbol.tsv")),
         ).optimize()
 
-        if deterministic:
-            graph |= graph.optimize()
-        else:
+        if not deterministic:
             graph |= _get_whitelist_graph(
                 input_case, get_abs_path("data/whitelist/abbreviations.tsv"), keep_punct_add_end=True
             )
@@ -40,7 +40,7 @@ class TelephoneFst(GraphFst):
             + pynini.closure(NEMO_NOT_QUOTE, 1)
             + pynutil.delete("\"")
         )
-        country_code = pynini.closure(country_code + insert_space, 0, 1)
+        country_code = pynini.closure(country_code + delete_space + insert_space, 0, 1)
 
         number = (
             pynutil.delete("number_part:")
@@ -15,6 +15,9 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import load_string_file
+from indic_text_normalization.token_fields import concat, field
 from ..graph_utils import (
     NEMO_DIGIT,
     NEMO_BRX_DIGIT,
@@ -33,15 +36,13 @@ from ..graph_utils import (
 from ..utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Bodo digits (०-९)
-arabic_to_brx_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_brx_number = pynini.closure(arabic_to_brx_digit).optimize()
+arabic_to_brx_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
+arabic_to_brx_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 # Keep old names for backward compatibility
 arabic_to_hindi_number = arabic_to_brx_number
 
+
 class MathFst(GraphFst):
     """
     Finite state transducer for classifying math expressions.
@@ -56,35 +57,21 @@ class MathFst(GraphFst):
     def __init__(self, cardinal: GraphFst, decimal: GraphFst = None, deterministic: bool = True):
         super().__init__(name="math", kind="classify", deterministic=deterministic)
 
+        # Right operand of all the compositions below, input label sorted by CardinalFst
         cardinal_graph = cardinal.final_graph
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
+        digit_words_graph = (digit_word_graph + pynini.closure(insert_space + digit_word_graph)).optimize()
+        digit_words_graph = digit_words_graph.arcsort("ilabel")
         
-        # Support both native and Arabic digits
-        # Native digits input
-        native_number_input = pynini.closure(NEMO_HI_DIGIT, 1)
-        native_number_graph = pynini.compose(native_number_input, cardinal_graph).optimize()
-        
-        # Arabic digits input
-        arabic_number_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_number_graph = pynini.compose(
-            arabic_number_input,
-            arabic_to_brx_number @ cardinal_graph
-        ).optimize()
-        
-        # Combined integer graph
-        integer_graph = (native_number_graph | arabic_number_graph).optimize()
+        # Support both native and Arabic digits, the cardinal graph reads both itself
+        number_input = pynini.closure(NEMO_HI_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1)
+        integer_graph = pynini.compose(number_input.optimize().arcsort("olabel"), cardinal_graph).optimize()
 
         # Decimal support inside math (needed for π equations)
         # Speak fractional digits digit-by-digit and use "दशमलव" as decimal separator.
-        native_frac = pynini.compose(
-            pynini.closure(NEMO_HI_DIGIT, 1),
-            digit_word_graph + pynini.closure(insert_space + digit_word_graph),
-        ).optimize()
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_brx_number @ (digit_word_graph + pynini.closure(insert_space + digit_word_graph)),
-        ).optimize()
-        fractional_graph = (native_frac | arabic_frac).optimize()
+        # Arabic digits are converted to native digits first.
+        native_digits_input = pynini.closure(NEMO_HI_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_brx_number
+        fractional_graph = pynini.compose(native_digits_input.optimize().arcsort("olabel"), digit_words_graph).optimize()
 
         point = pynutil.delete(".") + pynutil.insert(" दशमलव ")
         decimal_graph = (integer_graph + point + fractional_graph).optimize()
@@ -100,12 +87,9 @@ class MathFst(GraphFst):
         # Left operand can be Greek letter (translated) or number
         # Right operand should be number only (to avoid "π = λ" matching when we want "π = 3.14")
         left_operand_graph = (number_graph | greek_letters_translation).optimize()
-        right_operand_graph = number_graph.optimize()
-        
-        # General operand graph (for cases where either side can be number or Greek)
-        operand_graph = left_operand_graph.optimize()
+        right_operand_graph = number_graph
 
-        math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+        math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
         # Optional space around operators
         optional_space = pynini.closure(NEMO_SPACE, 0, 1)
@@ -113,153 +97,110 @@ class MathFst(GraphFst):
         
         # Operators that can appear between numbers
         operators = pynini.union("+", "-", "*", "÷", "×", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?", "≈", "√", "·")
-        operators = operators.optimize()
+        operators = operators.optimize().arcsort("olabel")
+        # Verbalized operators, shared by all the patterns below
+        op_graph = (operators @ math_operations).optimize()
 
         # Support for power expressions (e.g., 10⁻⁷, 2³)
         superscript_sign = pynini.closure(superscript_to_sign, 0, 1)
         superscript_number = pynini.closure(superscript_to_digit, 1)
         
-        power_expression = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"पावर\" ")
-            + pynutil.insert("right: \"")
-            + (superscript_sign @ pynini.cdrewrite(pynini.cross("-", "ऋणात्मक "), "", "", NEMO_SIGMA))
-            + (superscript_number @ cardinal_graph)
-            + pynutil.insert("\" ")
+        power_expression = concat(
+            field("left", number_graph),
+            " ",
+            field("operator", "पावर"),
+            " ",
+            field(
+                "right",
+                (superscript_sign @ pynini.cdrewrite(pynini.cross("-", "ऋणात्मक "), "", "", NEMO_SIGMA))
+                + (superscript_number @ cardinal_graph),
+            ),
+            " ",
         )
 
         # Math expression: operand operator operand
         # Left operand can be Greek letter or number, right operand should be number
-        math_expression = (
-            pynutil.insert("left: \"")
-            + left_operand_graph
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        math_expression = concat(
+            field("left", left_operand_graph),
+            " ",
+            delimiter,
+            field("operator", op_graph),
+            " ",
+            delimiter,
+            field("right", right_operand_graph),
+            " ",
         )
 
         # Extended math (e.g., 1+2+3 or π+2+3)
         # Left can be Greek letter or number, middle and right should be numbers
-        extended_math = (
-            pynutil.insert("left: \"")
-            + left_operand_graph
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("middle: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("operator_two: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        extended_math = concat(
+            field("left", left_operand_graph),
+            " ",
+            delimiter,
+            field("operator", op_graph),
+            " ",
+            delimiter,
+            field("middle", right_operand_graph),
+            " ",
+            delimiter,
+            field("operator_two", op_graph),
+            " ",
+            delimiter,
+            field("right", right_operand_graph),
+            " ",
         )
 
         # Support: operator number (e.g., "+5", "√9")
-        operator_number = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        operator_number = concat(
+            field("left"), " ", field("operator", op_graph), " ", delimiter, field("right", right_operand_graph), " "
         )
 
         # Support: number operator (e.g., "5+")
-        number_operator = (
-            pynutil.insert("left: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
+        number_operator = concat(
+            field("left", right_operand_graph), " ", delimiter, field("operator", op_graph), " ", field("right"), " "
         )
 
         # Support: standalone operator
-        standalone_operator = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-        )
+        standalone_operator = concat(field("left"), " ", field("operator", op_graph), " ", field("right"), " ")
 
         # Root expressions: √2, √3, etc. (square root)
         sqrt_symbol = pynini.accep("√")
         optional_space_after_sqrt = pynini.closure(NEMO_SPACE, 0, 1)
-        sqrt_expression = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross(sqrt_symbol, "वर्गमूल")
-            + pynutil.insert("\" ")
-            + optional_space_after_sqrt
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        sqrt_expression = concat(
+            field("left"),
+            " ",
+            field("operator", pynini.cross(sqrt_symbol, "वर्गमूल")),
+            " ",
+            optional_space_after_sqrt,
+            field("right", right_operand_graph),
+            " ",
         )
 
         # Special-case: tight dash patterns
         # Pattern 1: "10-2=8" should be treated as "दानख" (minus) - tight minus with equals
         # These are number-number patterns, so use right_operand_graph
-        math_expression_tight_minus_equals = (
-            pynutil.insert("left: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "दानख")
-            + pynutil.insert("\" ")
-            + pynutil.insert("middle: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "समान")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_equals = concat(
+            field("left", right_operand_graph),
+            " ",
+            field("operator", pynini.cross("-", "दानख")),
+            " ",
+            field("middle", right_operand_graph),
+            " ",
+            field("operator_two", pynini.cross("=", "समान")),
+            " ",
+            field("right", right_operand_graph),
+            " ",
         )
 
         # Pattern 2: "10-2 गेदेर संख्या" should be treated as "से" (from) - tight minus without equals
         # This matches number-number (no spaces around "-") and outputs a math token for just the pair.
-        math_expression_tight_minus_text = (
-            pynutil.insert("left: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "से")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + right_operand_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_text = concat(
+            field("left", right_operand_graph),
+            " ",
+            field("operator", pynini.cross("-", "से")),
+            " ",
+            field("right", right_operand_graph),
+            " ",
         )
 
         final_graph = (
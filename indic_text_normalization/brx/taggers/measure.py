@@ -16,6 +16,7 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.brx.graph_utils import (
     BRX_DEDH,
     BRX_DHAI,
@@ -399,7 +400,7 @@ class MeasureFst(GraphFst):
         math = None
         try:
             if os.path.exists(math_operations_path):
-                math_operations = pynini.string_file(math_operations_path)
+                math_operations = load_string_file(math_operations_path)
                 delimiter = pynini.accep(" ") | pynutil.insert(" ")
                 
                 math_expr = (
@@ -70,7 +70,7 @@ class MoneyFst(GraphFst):
         # Use cardinal_with_commas (higher priority) to handle numbers with commas, fallback to regular cardinal_graph
         integer = pynutil.insert('integer_part: "') + (pynutil.add_weight(cardinal_with_commas, -0.1) | cardinal_graph) + pynutil.insert('"')
         fraction = pynutil.insert('fractional_part: "') + (pynutil.add_weight(cardinal_with_commas, -0.1) | cardinal_graph) + pynutil.insert('"')
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         graph_major_only = optional_graph_negative + currency_major + insert_space + integer
         graph_major_and_minor = (
@@ -16,6 +16,10 @@ import pynini
 from pynini.lib import pynutil
 
 from indic_text_normalization.brx.graph_utils import GraphFst, NEMO_DIGIT, NEMO_BRX_DIGIT, insert_space
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
+
+# Arabic digits -> Bodo digits
+arabic_to_brx_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 
 class ScientificFst(GraphFst):
@@ -37,39 +41,16 @@ class ScientificFst(GraphFst):
         cardinal_graph = cardinal.final_graph
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
 
-        # Arabic digits -> Bodo digits
-        arabic_to_brx_digit = pynini.string_map(
-            [
-                ("0", "०"),
-                ("1", "१"),
-                ("2", "२"),
-                ("3", "३"),
-                ("4", "४"),
-                ("5", "५"),
-                ("6", "६"),
-                ("7", "७"),
-                ("8", "८"),
-                ("9", "९"),
-            ]
-        ).optimize()
-        arabic_to_brx_number = pynini.closure(arabic_to_brx_digit).optimize()
-
-        # Integer part for mantissa
-        brx_int = pynini.compose(pynini.closure(NEMO_BRX_DIGIT, 1), cardinal_graph).optimize()
-        arabic_int = pynini.compose(pynini.closure(NEMO_DIGIT, 1), arabic_to_brx_number @ cardinal_graph).optimize()
-        integer_graph = (brx_int | arabic_int).optimize()
+        # Integer part for mantissa, the cardinal graph reads both Bodo and Arabic digits itself
+        number_input = pynini.closure(NEMO_BRX_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1)
+        integer_graph = pynini.compose(number_input.optimize().arcsort("olabel"), cardinal_graph).optimize()
 
         # Fractional digits spoken digit-by-digit
-        # Input side: Bodo digits; Output side: Bodo words with spaces
-        brx_frac = (digit_word_graph + pynini.closure(insert_space + digit_word_graph)).optimize()
-        
-        # Arabic digits path: Arabic digits -> convert to Bodo -> verbalized digits
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_brx_number @ brx_frac
-        ).optimize()
-        
-        fractional_graph = (brx_frac | arabic_frac).optimize()
+        # Input side: Bodo digits, or Arabic digits converted to Bodo; Output side: Bodo words with spaces
+        brx_frac = (digit_word_graph + pynini.closure(insert_space + digit_word_graph)).optimize().arcsort("ilabel")
+        brx_digits_input = pynini.closure(NEMO_BRX_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_brx_number
+        fractional_graph = pynini.compose(brx_digits_input.optimize().arcsort("olabel"), brx_frac).optimize()
+
         point = pynutil.delete(".") + pynutil.insert(" दशमलव ")
         mantissa_graph = (integer_graph + point + fractional_graph).optimize()
 
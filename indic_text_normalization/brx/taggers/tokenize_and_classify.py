@@ -33,7 +33,7 @@ from indic_text_normalization.brx.graph_utils import (
     generator_main,
 )
 from indic_text_normalization.brx.taggers.abbreviation import AbbreviationFst
-from indic_text_normalization.brx.taggers.cardinal import CardinalFst
+from indic_text_normalization.brx.taggers.cardinal import get_cardinal_fst
 from indic_text_normalization.brx.taggers.date import DateFst
 from indic_text_normalization.brx.taggers.decimal import DecimalFst
 from indic_text_normalization.brx.taggers.electronic import ElectronicFst
@@ -96,7 +96,7 @@ class ClassifyFst(GraphFst):
             logging.info(f"Creating ClassifyFst grammars.")
 
             start_time = time.time()
-            cardinal = CardinalFst(deterministic=deterministic)
+            cardinal = get_cardinal_fst(deterministic=deterministic)
             cardinal_graph = cardinal.fst
             logging.debug(f"cardinal: {time.time() - start_time:.2f}s -- {cardinal_graph.num_states()} nodes")
 
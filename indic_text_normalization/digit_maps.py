@@ -0,0 +1,64 @@
+# Copyright (c) 2025, Kenpath Technologies Pvt Ltd.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+from typing import Dict, FrozenSet, Tuple
+
+import pynini
+
+ARABIC_DIGITS = "0123456789"
+BENGALI_DIGITS = "০১২৩৪৫৬৭৮৯"  # also used by Assamese
+DEVANAGARI_DIGITS = "०१२३४५६७८९"
+GUJARATI_DIGITS = "૦૧૨૩૪૫૬૭૮૯"
+KANNADA_DIGITS = "೦೧೨೩೪೫೬೭೮೯"
+
+
+@functools.lru_cache(maxsize=None)
+def _digit_map_graphs(pairs: FrozenSet[Tuple[str, str]]) -> Tuple['pynini.FstLike', 'pynini.FstLike']:
+    digit = pynini.union(*[pynini.cross(arabic, native) for arabic, native in sorted(pairs)]).optimize()
+    # the number map is the left operand of compositions with cardinal graphs
+    return digit, pynini.closure(digit).optimize().arcsort("olabel")
+
+
+def arabic_to_native_digit(native_digits: str) -> 'pynini.FstLike':
+    """
+    Returns a transducer converting a single Arabic digit (0-9) to a native script digit.
+    The graph is shared by all languages using the same digits, e.g. Bengali and Assamese.
+
+    Args:
+        native_digits: the ten native script digits from zero to nine
+    """
+    return _digit_map_graphs(frozenset(zip(ARABIC_DIGITS, native_digits)))[0]
+
+
+def arabic_to_native_number(native_digits: str) -> 'pynini.FstLike':
+    """
+    Returns a transducer converting a sequence of Arabic digits to native script digits.
+    The graph is shared by all languages using the same digits, e.g. Bengali and Assamese.
+
+    Args:
+        native_digits: the ten native script digits from zero to nine
+    """
+    return _digit_map_graphs(frozenset(zip(ARABIC_DIGITS, native_digits)))[1]
+
+
+def arabic_to_native_table(native_digits: str) -> Dict[int, int]:
+    """
+    Returns a str.translate table converting Arabic digits to native script digits, for plain
+    numeric strings that do not need to go through a transducer.
+
+    Args:
+        native_digits: the ten native script digits from zero to nine
+    """
+    return str.maketrans(ARABIC_DIGITS, native_digits)
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import threading
+
 import pynini
 from pynini.lib import pynutil
 
@@ -376,6 +379,30 @@ class CardinalFst(GraphFst):
         optional_minus_graph = pynini.closure(pynutil.insert("negative: ") + pynini.cross("-", "\"true\" "), 0, 1)
 
         self.final_graph = final_graph.optimize()
+        # Other taggers compose their digit inputs with the number graph
+        self.final_graph.arcsort("ilabel")
         final_graph = optional_minus_graph + pynutil.insert("integer: \"") + self.final_graph + pynutil.insert("\"")
         final_graph = self.add_tokens(final_graph)
         self.fst = final_graph
+
+
+_cardinal_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_cardinal_fst(deterministic: bool, lm: bool) -> CardinalFst:
+    return CardinalFst(deterministic=deterministic, lm=lm)
+
+
+def get_cardinal_fst(deterministic: bool = True, lm: bool = False) -> CardinalFst:
+    """
+    Returns a CardinalFst shared within the process, the graphs are never modified after construction.
+
+    Args:
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+        lm: passed through to CardinalFst
+    """
+    # pynini graph construction is not reentrant, so only one thread builds at a time
+    with _cardinal_lock:
+        return _cached_cardinal_fst(deterministic, lm)
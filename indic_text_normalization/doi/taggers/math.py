@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.doi.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -23,19 +24,63 @@ from indic_text_normalization.doi.graph_utils import (
     GraphFst,
     insert_space,
 )
-from indic_text_normalization.doi.utils import get_abs_path
+from indic_text_normalization.doi.utils import get_abs_path, load_labels
 
 # Convert Arabic digits (0-9) to Dogri digits (०-९)
-arabic_to_dogri_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_dogri_number = pynini.closure(arabic_to_dogri_digit).optimize()
-
-# Load math operations and Greek letters
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+arabic_to_dogri_digit = arabic_to_native_digit(DEVANAGARI_DIGITS)
+arabic_to_dogri_number = arabic_to_native_number(DEVANAGARI_DIGITS)
+
+# Operators that can appear between numbers; : and / are excluded to avoid conflicts with time and dates
+# Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
+OPERATORS = (
+    "+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?",
+    "×", "÷", "√", "≈", "·", "x", "X",
+)
+
+
+def _load_operator_map(path: str, allowed) -> pynini.Fst:
+    """
+    Builds the verbalization of the allowed operators directly from their rows of the tsv file.
+    As with pynini.string_file, lines starting with "#" are comments.
+
+    Args:
+        path: absolute path to the operator tsv file
+        allowed: operator symbols to keep
+    """
+    rows = [
+        (row[0], row[1])
+        for row in load_labels(path)
+        if len(row) > 1 and not row[0].startswith("#") and row[0] in allowed
+    ]
+    return pynini.string_map(rows).optimize()
+
+
+# Verbalized operators and Greek letters
+operator_map = _load_operator_map(get_abs_path("data/math_operations.tsv"), set(OPERATORS))
 greek_letters = pynini.string_file(get_abs_path("data/greek.tsv"))
 
+# Support both Dogri and Arabic digits: Arabic digits are converted to Dogri digits on the input side,
+# so that each graph reading Dogri digits is composed once rather than once per script
+dogri_digits_input = pynini.closure(NEMO_HI_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_dogri_number
+dogri_digits_input = dogri_digits_input.optimize().arcsort("olabel")
+
+
+def _get_number_graph(cardinal: GraphFst) -> pynini.Fst:
+    """
+    Reads Dogri or Arabic digit strings with the cardinal graph, built once per cardinal instance
+    as its final_graph is never modified after construction. The graph is kept on the cardinal,
+    so that it is released together with it.
+
+    Args:
+        cardinal: cardinal GraphFst
+    """
+    number_graph = getattr(cardinal, "_math_number_graph", None)
+    if number_graph is None:
+        # The cardinal graph is input label sorted by CardinalFst, as the right operand of the composition
+        number_graph = pynini.compose(dogri_digits_input, cardinal.final_graph).optimize()
+        cardinal._math_number_graph = number_graph
+    return number_graph
+
 
 class MathFst(GraphFst):
     """
@@ -53,38 +98,16 @@ class MathFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="math", kind="classify", deterministic=deterministic)
 
-        cardinal_graph = cardinal.final_graph
-        
-        # Support both Dogri and Arabic digits
-        # Dogri digits input
-        dogri_number_input = pynini.closure(NEMO_HI_DIGIT, 1)
-        dogri_number_graph = pynini.compose(dogri_number_input, cardinal_graph).optimize()
-        
-        # Arabic digits input
-        arabic_number_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_number_graph = pynini.compose(
-            arabic_number_input,
-            arabic_to_dogri_number @ cardinal_graph
-        ).optimize()
-        
         # Combined number graph
-        number_graph = dogri_number_graph | arabic_number_graph
+        number_graph = _get_number_graph(cardinal)
 
         # Decimal support inside math (needed for π equations)
         # Speak fractional digits digit-by-digit and use "दशमलव" as decimal separator.
-        cardinal_digit_graph = (cardinal.digit | cardinal.zero).optimize()
-        
-        dogri_frac = pynini.compose(
-            pynini.closure(NEMO_HI_DIGIT, 1),
-            cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph),
-        ).optimize()
-        
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_dogri_number @ (cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph)),
-        ).optimize()
-        
-        fractional_graph = (dogri_frac | arabic_frac).optimize()
+        cardinal_digit_graph = cardinal.digit | cardinal.zero
+        digit_words_graph = cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph)
+        digit_words_graph = digit_words_graph.optimize().arcsort("ilabel")
+
+        fractional_graph = pynini.compose(dogri_digits_input, digit_words_graph)
 
         point = pynutil.delete(".") + pynutil.insert(" दशमलव ")
         decimal_graph = (number_graph + point + fractional_graph).optimize()
@@ -92,59 +115,40 @@ class MathFst(GraphFst):
         # Greek letters support
         greek_graph = greek_letters
 
-        # Greek letters support
-        greek_graph = greek_letters
-
-        # Square root support moved to operators
-
+        # Verbalized operators, shared by all the patterns below
+        op_graph = operator_map
 
-        # Operands supported by math expressions: numbers, Greek letters, square root, or alphanumeric strings
         # Alphanumeric support for mixed scripts/words in math (e.g. "pi = 3.14... text")
-        # Exclude operators, space, and digits to avoid ambiguity
-        
-        # Operators that can appear between numbers (moved up for alpha definition)
-        # Operators that can appear between numbers (moved up for alpha definition)
-        # Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
-        operators = pynini.union("+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?", "×", "÷", "√", "≈", "·", "x", "X")
-
-        # Extract just the Greek characters (input side) from the mapping
+        # Exclude operators, space, digits and Greek letters to avoid ambiguity
         greek_char = pynini.project(greek_letters, "input")
-        
+
         # Alpha char should NOT exclude 'x' or 'X' even though they are operators now
         # because we want to support 'x' as a variable too (e.g. sqrt(x))
-        operators_excluding_x = pynini.difference(operators, pynini.union("x", "X"))
+        operators_excluding_x = pynini.union(*(op for op in OPERATORS if op not in ("x", "X")))
 
         alpha_char = pynini.difference(
-            NEMO_CHAR, 
+            NEMO_CHAR,
             operators_excluding_x | NEMO_SPACE | NEMO_DIGIT | NEMO_HI_DIGIT | greek_char
         ).optimize()
         alpha_graph = pynini.closure(alpha_char, 1)
 
-        # Operands supported by math expressions
+        # Operands supported by math expressions: numbers, Greek letters or alphanumeric strings
         # Prefer decimals when they match (weight -0.1), otherwise fall back to other types
-        # Operands supported by math expressions
-        # Prefer decimals when they match (weight -0.1), otherwise fall back to other types
-        # Removed sqrt_graph (now an operator)
         operand_graph = pynutil.add_weight(decimal_graph, -0.1) | number_graph | greek_graph | alpha_graph
 
         # Optional space around operators
         optional_space = pynini.closure(NEMO_SPACE, 0, 1)
         delimiter = optional_space | pynutil.insert(" ")
 
-        # Operators that can appear between numbers
-        # Exclude : and / to avoid conflicts with time and dates
-        # operators definition moved up
+        # Left operand followed by a delimiter, shared by the patterns starting with an operand
+        left_operand = pynutil.insert("left: \"") + operand_graph + pynutil.insert("\"") + delimiter
 
-        
         # Math expression: number operator number
         # Pattern: number [space] operator [space] number
         math_expression = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
+            left_operand
             + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
+            + op_graph
             + pynutil.insert("\"")
             + delimiter
             + pynutil.insert("right: \"")
@@ -155,12 +159,9 @@ class MathFst(GraphFst):
         # Also support: number operator number operator number (for longer expressions)
         # This handles cases like "1+2+3"
         extended_math = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
+            left_operand
             + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
+            + op_graph
             + pynutil.insert("\"")
             + delimiter
             + pynutil.insert("middle: \"")
@@ -168,7 +169,7 @@ class MathFst(GraphFst):
             + pynutil.insert("\"")
             + delimiter
             + pynutil.insert("operator_two: \"")
-            + (operators @ math_operations)
+            + op_graph
             + pynutil.insert("\"")
             + delimiter
             + pynutil.insert("right: \"")
@@ -178,11 +179,9 @@ class MathFst(GraphFst):
 
         # Support: operator number (e.g., "+5", "*3")
         operator_number = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
+            pynutil.insert("left: \"\"")
             + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
+            + op_graph
             + pynutil.insert("\"")
             + delimiter
             + pynutil.insert("right: \"")
@@ -192,29 +191,20 @@ class MathFst(GraphFst):
 
         # Support: number operator (e.g., "5+", "3*")
         number_operator = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
+            left_operand
             + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
+            + op_graph
             + pynutil.insert("\"")
+            + pynutil.insert("right: \"\"")
         )
 
         # Support: standalone operator (e.g., "+", "*", "?")
         standalone_operator = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
+            pynutil.insert("left: \"\"")
             + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
+            + op_graph
             + pynutil.insert("\"")
+            + pynutil.insert("right: \"\"")
         )
 
         # Special-case: tight dash patterns (from Hindi implementation)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 import time
@@ -28,7 +29,7 @@ from indic_text_normalization.doi.graph_utils import (
     generator_main,
 )
 from indic_text_normalization.doi.taggers.abbreviation import AbbreviationFst
-from indic_text_normalization.doi.taggers.cardinal import CardinalFst
+from indic_text_normalization.doi.taggers.cardinal import get_cardinal_fst
 from indic_text_normalization.doi.taggers.date import DateFst
 from indic_text_normalization.doi.taggers.decimal import DecimalFst
 from indic_text_normalization.doi.taggers.electronic import ElectronicFst
@@ -49,6 +50,32 @@ from indic_text_normalization.doi.taggers.word import WordFst
 from indic_text_normalization.doi.verbalizers.date import DateFst as vDateFst
 from indic_text_normalization.doi.verbalizers.ordinal import OrdinalFst as vOrdinalFst
 from indic_text_normalization.doi.verbalizers.time import TimeFst as vTimeFst
+from indic_text_normalization.graph_build import build_graphs
+
+# Taggers built only from the cardinal graph, whose instances are not needed by other taggers,
+# so they can be built independently of each other
+CARDINAL_TAGGERS = {
+    "date": lambda cardinal, deterministic: DateFst(cardinal=cardinal),
+    "time": lambda cardinal, deterministic: TimeFst(cardinal=cardinal),
+    "money": lambda cardinal, deterministic: MoneyFst(cardinal=cardinal),
+    "math": lambda cardinal, deterministic: _get_math_fst(cardinal=cardinal, deterministic=deterministic),
+    "power": lambda cardinal, deterministic: PowerFst(cardinal=cardinal, deterministic=deterministic),
+    "scientific": lambda cardinal, deterministic: ScientificFst(cardinal=cardinal, deterministic=deterministic),
+    "electronic": lambda cardinal, deterministic: ElectronicFst(cardinal=cardinal, deterministic=deterministic),
+}
+
+
+def _get_math_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.doi.taggers.math import MathFst
+
+    return MathFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _build_tagger_graph(name: str, deterministic: bool):
+    """
+    Builds the graph of one of CARDINAL_TAGGERS
+    """
+    return CARDINAL_TAGGERS[name](get_cardinal_fst(deterministic=deterministic), deterministic).fst
 
 
 class ClassifyFst(GraphFst):
@@ -91,10 +118,22 @@ class ClassifyFst(GraphFst):
             logging.info(f"Creating ClassifyFst grammars.")
 
             start_time = time.time()
-            cardinal = CardinalFst(deterministic=deterministic)
+            cardinal = get_cardinal_fst(deterministic=deterministic)
             cardinal_graph = cardinal.fst
             logging.debug(f"cardinal: {time.time() - start_time:.2f}s -- {cardinal_graph.num_states()} nodes")
 
+            # built after the cardinal graph, so that forked workers inherit it instead of building it again
+            tagger_graphs = build_graphs(
+                functools.partial(_build_tagger_graph, deterministic=deterministic), CARDINAL_TAGGERS
+            )
+            date_graph = tagger_graphs["date"]
+            time_graph = tagger_graphs["time"]
+            money_graph = tagger_graphs["money"]
+            math_graph = tagger_graphs["math"]
+            power_graph = tagger_graphs["power"]
+            scientific_graph = tagger_graphs["scientific"]
+            electronic_graph = tagger_graphs["electronic"]
+
             start_time = time.time()
             ordinal = OrdinalFst(cardinal=cardinal, deterministic=deterministic)
             ordinal_graph = ordinal.fst
@@ -110,42 +149,11 @@ class ClassifyFst(GraphFst):
             fraction_graph = fraction.fst
             logging.debug(f"fraction: {time.time() - start_time:.2f}s -- {fraction_graph.num_states()} nodes")
 
-            start_time = time.time()
-            date = DateFst(cardinal=cardinal)
-            date_graph = date.fst
-            logging.debug(f"date: {time.time() - start_time:.2f}s -- {date_graph.num_states()} nodes")
-
-            start_time = time.time()
-            timefst = TimeFst(cardinal=cardinal)
-            time_graph = timefst.fst
-            logging.debug(f"time: {time.time() - start_time:.2f}s -- {time_graph.num_states()} nodes")
-
             start_time = time.time()
             measure = MeasureFst(cardinal=cardinal, decimal=decimal, fraction=fraction, deterministic=deterministic)
             measure_graph = measure.fst
             logging.debug(f"measure: {time.time() - start_time:.2f}s -- {measure_graph.num_states()} nodes")
 
-            start_time = time.time()
-            money = MoneyFst(cardinal=cardinal)
-            money_graph = money.fst
-            logging.debug(f"money: {time.time() - start_time:.2f}s -- {money_graph.num_states()} nodes")
-
-            start_time = time.time()
-            from indic_text_normalization.doi.taggers.math import MathFst
-            math = MathFst(cardinal=cardinal, deterministic=deterministic)
-            math_graph = math.fst
-            logging.debug(f"math: {time.time() - start_time:.2f}s -- {math_graph.num_states()} nodes")
-
-            start_time = time.time()
-            power = PowerFst(cardinal=cardinal, deterministic=deterministic)
-            power_graph = power.fst
-            logging.debug(f"power: {time.time() - start_time:.2f}s -- {power_graph.num_states()} nodes")
-
-            start_time = time.time()
-            scientific = ScientificFst(cardinal=cardinal, deterministic=deterministic)
-            scientific_graph = scientific.fst
-            logging.debug(f"scientific: {time.time() - start_time:.2f}s -- {scientific_graph.num_states()} nodes")
-
             start_time = time.time()
             whitelist = WhiteListFst(
                 input_case=input_case, deterministic=deterministic, input_file=whitelist
@@ -163,11 +171,6 @@ class ClassifyFst(GraphFst):
             telephone_graph = telephone.fst
             logging.debug(f"telephone: {time.time() - start_time:.2f}s -- {telephone_graph.num_states()} nodes")
 
-            start_time = time.time()
-            electronic = ElectronicFst(cardinal=cardinal, deterministic=deterministic)
-            electronic_graph = electronic.fst
-            logging.debug(f"electronic: {time.time() - start_time:.2f}s -- {electronic_graph.num_states()} nodes")
-
             start_time = time.time()
             serial = SerialFst(cardinal=cardinal, ordinal=ordinal, deterministic=deterministic)
             serial_graph = serial.fst
@@ -12,12 +12,46 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+
 import pynini
 from pynini.lib import pynutil
 
 from indic_text_normalization.doi.graph_utils import NEMO_NOT_QUOTE, GraphFst, insert_space
 
 
+@functools.lru_cache(maxsize=None)
+def _build_scientific_fst(deterministic: bool) -> pynini.Fst:
+    """
+    Builds the scientific verbalizer, which only depends on the token layout and is therefore
+    built once per process and shared by all ScientificFst instances.
+    """
+    delete_space = pynutil.delete(" ")
+
+    mantissa = pynutil.delete('mantissa: "') + pynini.closure(NEMO_NOT_QUOTE, 1) + pynutil.delete('"')
+
+    optional_sign = pynini.closure(
+        delete_space
+        + pynutil.delete('sign: "')
+        + pynini.closure(NEMO_NOT_QUOTE, 1)
+        + pynutil.delete('"')
+        + insert_space,
+        0,
+        1,
+    )
+
+    exponent = (
+        delete_space
+        + pynutil.delete('exponent: "')
+        + pynini.closure(NEMO_NOT_QUOTE, 1)
+        + pynutil.delete('"')
+    )
+
+    graph = mantissa + pynutil.insert(" गुणा दह पावर ") + optional_sign + exponent
+    wrapper = GraphFst(name="scientific", kind="verbalize", deterministic=deterministic)
+    return wrapper.delete_tokens(graph).optimize()
+
+
 class ScientificFst(GraphFst):
     """
     Verbalize scientific-notation tokens, e.g.
@@ -30,31 +64,4 @@ class ScientificFst(GraphFst):
 
     def __init__(self, deterministic: bool = True):
         super().__init__(name="scientific", kind="verbalize", deterministic=deterministic)
-
-        delete_space = pynutil.delete(" ")
-
-        mantissa = (
-            pynutil.delete('mantissa: "')
-            + pynini.closure(NEMO_NOT_QUOTE, 1)
-            + pynutil.delete('"')
-        )
-
-        optional_sign = pynini.closure(
-            delete_space
-            + pynutil.delete('sign: "')
-            + pynini.closure(NEMO_NOT_QUOTE, 1)
-            + pynutil.delete('"')
-            + insert_space,
-            0,
-            1,
-        )
-
-        exponent = (
-            delete_space
-            + pynutil.delete('exponent: "')
-            + pynini.closure(NEMO_NOT_QUOTE, 1)
-            + pynutil.delete('"')
-        )
-
-        graph = mantissa + pynutil.insert(" गुणा दह पावर ") + optional_sign + exponent
-        self.fst = self.delete_tokens(graph).optimize()
+        self.fst = _build_scientific_fst(deterministic)
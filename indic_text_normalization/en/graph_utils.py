@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import os
 import string
 from pathlib import Path
@@ -24,6 +25,7 @@ from pynini.examples import plurals
 from pynini.export import export
 from pynini.lib import byte, pynutil, utf8
 
+from indic_text_normalization import graph_cache
 from indic_text_normalization.en.utils import get_abs_path, load_labels
 from indic_text_normalization.logging import logger
 
@@ -186,6 +188,10 @@ def generator_main(file_name: str, graphs: Dict[str, "pynini.FstLike"]):
     logger.info(f"Created {file_name}")
 
 
+# Cache key of a graph built with this module, see graph_cache.get_cache_key()
+get_cache_key = functools.partial(graph_cache.get_cache_key, modules=[__file__])
+
+
 def get_plurals(fst):
     """
     Given singular returns plurals
@@ -13,6 +13,9 @@
 # limitations under the License.
 
 
+import functools
+import os
+
 import pynini
 from pynini.examples import plurals
 from pynini.lib import pynutil
@@ -22,10 +25,49 @@ from indic_text_normalization.en.graph_utils import (
     NEMO_NOT_QUOTE,
     NEMO_SIGMA,
     GraphFst,
+    get_cache_key,
     insert_space,
 )
+from indic_text_normalization.en.taggers import date
 from indic_text_normalization.en.taggers.date import get_four_digit_year_graph
 from indic_text_normalization.en.utils import get_abs_path
+from indic_text_normalization.graph_cache import CACHE_DIR, load_far_graph, load_or_build, load_string_file
+
+# Data files the number graphs are built from, directly or through the date tagger
+NUMBER_DATA_FILES = [
+    "cardinal_number_name.far",
+    "cardinal_number_name_au.far",
+    "digit.tsv",
+    "zero.tsv",
+    "teen.tsv",
+    "ty.tsv",
+]
+
+# Alternative readings of the non-deterministic graph: "a hundred" for "one hundred" etc.
+_ONE_TO_A = (
+    pynini.union(
+        pynini.cross("one hundred", "a hundred"),
+        pynini.cross("one thousand", "thousand"),
+        pynini.cross("one million", "a million"),
+    )
+    + NEMO_SIGMA
+).optimize().arcsort("ilabel")
+# Four digit numbers written with a comma, e.g. "1,000"
+_FOUR_DIGIT_COMMA = ((NEMO_DIGIT - "0") + pynutil.delete(",") + NEMO_DIGIT**3).optimize().arcsort("olabel")
+
+
+@functools.lru_cache(maxsize=None)
+def _and_insertion_contexts():
+    """
+    Returns the acceptors for number names without "thousand"/"million" and without "hundred",
+    which only depend on the alphabet and are shared by all CardinalFst instances.
+    """
+    not_quote = pynini.closure(NEMO_NOT_QUOTE)
+    no_thousand_million = pynini.difference(
+        not_quote, not_quote + pynini.union("thousand", "million") + not_quote
+    ).optimize()
+    no_hundred = pynini.difference(NEMO_SIGMA, not_quote + pynini.accep("hundred") + not_quote).optimize()
+    return no_thousand_million, no_hundred
 
 
 class CardinalFst(GraphFst):
@@ -43,15 +85,35 @@ class CardinalFst(GraphFst):
 
         self.lm = lm
         self.deterministic = deterministic
+
+        # Building the number graphs is slow, so they are cached on disk keyed by the grammar and data files
+        data_files = [get_abs_path(f"data/number/{name}") for name in NUMBER_DATA_FILES]
+        cache_key = get_cache_key([__file__, date.__file__] + data_files, deterministic, lm)
+        far_file = os.path.join(CACHE_DIR, f"en_cardinal_{cache_key}.far")
+        graphs = load_or_build(far_file, lambda: self._build_graphs(deterministic))
+        # Graphs other taggers are built from
+        for rule, graph in graphs.items():
+            setattr(self, rule, graph)
+
+        optional_minus_graph = pynini.closure(pynutil.insert("negative: ") + pynini.cross("-", "\"true\" "), 0, 1)
+
+        final_graph = optional_minus_graph + pynutil.insert("integer: \"") + self.final_graph + pynutil.insert("\"")
+        final_graph = self.add_tokens(final_graph)
+        self.fst = final_graph.optimize()
+
+    def _build_graphs(self, deterministic: bool):
+        """
+        Builds the number graphs, returns a mapping of attribute names to graphs
+        """
         # TODO replace to have "oh" as a default for "0"
-        graph = pynini.Far(get_abs_path("data/number/cardinal_number_name.far")).get_fst()
-        graph_au = pynini.Far(get_abs_path("data/number/cardinal_number_name_au.far")).get_fst()
+        graph = load_far_graph(get_abs_path("data/number/cardinal_number_name.far"))
+        graph_au = load_far_graph(get_abs_path("data/number/cardinal_number_name_au.far"))
         self.graph_hundred_component_at_least_one_none_zero_digit = (
             pynini.closure(NEMO_DIGIT, 2, 3) | pynini.difference(NEMO_DIGIT, pynini.accep("0"))
         ) @ graph
 
-        graph_digit = pynini.string_file(get_abs_path("data/number/digit.tsv"))
-        graph_zero = pynini.string_file(get_abs_path("data/number/zero.tsv"))
+        graph_digit = load_string_file(get_abs_path("data/number/digit.tsv"))
+        graph_zero = load_string_file(get_abs_path("data/number/zero.tsv"))
 
         single_digits_graph = pynini.invert(graph_digit | graph_zero)
         self.single_digits_graph = single_digits_graph + pynini.closure(insert_space + single_digits_graph)
@@ -79,12 +141,13 @@ class CardinalFst(GraphFst):
                 1,
             )
 
-        optional_minus_graph = pynini.closure(pynutil.insert("negative: ") + pynini.cross("-", "\"true\" "), 0, 1)
-
-        graph = (
+        # digits either grouped by commas throughout or not at all; determinized
+        # once so the composition below does not branch on every leading digit
+        digit_filter = (
             pynini.closure(NEMO_DIGIT, 1, 3)
             + (pynini.closure(pynutil.delete(",") + NEMO_DIGIT**3) | pynini.closure(NEMO_DIGIT**3))
-        ) @ graph
+        ).optimize().arcsort("olabel")
+        graph = digit_filter @ graph
 
         self.graph = graph
         self.graph_with_and = self.add_optional_and(graph)
@@ -92,23 +155,15 @@ class CardinalFst(GraphFst):
         if deterministic:
             # Exclude phone-number-like patterns (7-10 digits) from proper number normalization
             # But preserve round numbers (ending in many zeros) which should be normalized properly
-            # Phone numbers are typically 7-10 digits that don't end in many zeros
-            phone_number_pattern_7 = NEMO_DIGIT ** 7  # Exactly 7 digits
-            phone_number_pattern_8 = NEMO_DIGIT ** 8  # Exactly 8 digits  
-            phone_number_pattern_9 = NEMO_DIGIT ** 9  # Exactly 9 digits
-            # 10 digits: exclude unless it's a round number (ends with at least 6 zeros)
-            phone_number_pattern_10 = (
-                NEMO_DIGIT ** 4 + pynini.difference(NEMO_DIGIT ** 6, "000000")
-            )  # 4 digits + 6 digits that aren't all zeros
-            phone_number_pattern = (
-                phone_number_pattern_7 
-                | phone_number_pattern_8 
-                | phone_number_pattern_9 
-                | phone_number_pattern_10
+            # Phone numbers are typically 7-10 digits that don't end in many zeros; 10-digit
+            # round numbers (ending with six zeros) are kept
+            phone_number_pattern = pynini.difference(
+                pynini.closure(NEMO_DIGIT, 7, 10), NEMO_DIGIT**4 + "000000"
             ).optimize()
-            # Get the input domain of the proper number graph and exclude phone number patterns
-            graph_input_domain = pynini.project(self.graph_with_and, "input")
-            non_phone_inputs = pynini.difference(graph_input_domain, phone_number_pattern).optimize()
+            # Exclude phone number patterns from the digit strings, with or without commas, the number graph reads.
+            # The difference is taken on this small acceptor rather than on the projected input of the number graph
+            number_inputs = pynini.closure(pynini.union(NEMO_DIGIT, ","), 1)
+            non_phone_inputs = pynini.difference(number_inputs, phone_number_pattern).optimize().arcsort("olabel")
             # Filter the graph: compose with non_phone_inputs (which acts as an identity FST for allowed inputs)
             # This keeps only paths where the input is in non_phone_inputs
             graph_excluding_phone = pynini.compose(non_phone_inputs, self.graph_with_and).optimize()
@@ -126,8 +181,7 @@ class CardinalFst(GraphFst):
             cardinal_with_leading_zeros = pynini.compose(
                 pynini.accep("0") + pynini.closure(NEMO_DIGIT), self.single_digits_graph
             )
-            final_graph = self.long_numbers | cardinal_with_leading_zeros
-            final_graph |= self.add_optional_and(graph_au)
+            final_graph = pynini.union(self.long_numbers, cardinal_with_leading_zeros, self.add_optional_and(graph_au))
         else:
             leading_zeros = pynini.compose(pynini.closure(pynini.accep("0"), 1), self.single_digits_graph)
             cardinal_with_leading_zeros = (
@@ -135,27 +189,29 @@ class CardinalFst(GraphFst):
             )
             self.long_numbers = self.graph_with_and | pynutil.add_weight(self.single_digits_graph, 0.0001)
             # add small weight to non-default graphs to make sure the deterministic option is listed first
-            final_graph = (
-                self.long_numbers
-                | get_four_digit_year_graph()  # allows e.g. 4567 be pronounced as forty five sixty seven
-                | pynutil.add_weight(single_digits_graph_with_commas, 0.0001)
-                | cardinal_with_leading_zeros
-            ).optimize()
-
-            one_to_a_replacement_graph = (
-                pynini.cross("one hundred", "a hundred")
-                | pynini.cross("one thousand", "thousand")
-                | pynini.cross("one million", "a million")
-            )
-            final_graph |= pynini.compose(final_graph, one_to_a_replacement_graph.optimize() + NEMO_SIGMA).optimize()
-            # remove commas for 4 digits numbers
-            four_digit_comma_graph = (NEMO_DIGIT - "0") + pynutil.delete(",") + NEMO_DIGIT**3
-            final_graph |= pynini.compose(four_digit_comma_graph.optimize(), final_graph).optimize()
-
-        self.final_graph = final_graph
-        final_graph = optional_minus_graph + pynutil.insert("integer: \"") + final_graph + pynutil.insert("\"")
-        final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph.optimize()
+            alternatives = [
+                self.long_numbers,
+                get_four_digit_year_graph(),  # allows e.g. 4567 be pronounced as forty five sixty seven
+                pynutil.add_weight(single_digits_graph_with_commas, 0.0001),
+                cardinal_with_leading_zeros,
+            ]
+            final_graph = pynini.union(*alternatives).optimize()
+
+            final_graph = pynini.union(final_graph, pynini.compose(final_graph, _ONE_TO_A)).optimize()
+            # remove commas for 4 digits numbers, the numbers are read by the graph of all the readings above
+            final_graph.arcsort("ilabel")
+            final_graph = pynini.union(final_graph, pynini.compose(_FOUR_DIGIT_COMMA, final_graph)).optimize()
+
+        return {
+            "final_graph": final_graph,
+            "graph": self.graph,
+            "graph_with_and": self.graph_with_and,
+            "graph_hundred_component_at_least_one_none_zero_digit": (
+                self.graph_hundred_component_at_least_one_none_zero_digit
+            ),
+            "single_digits_graph": self.single_digits_graph,
+            "long_numbers": self.long_numbers,
+        }
 
     def add_optional_and(self, graph):
         graph_with_and = graph
@@ -163,14 +219,11 @@ class CardinalFst(GraphFst):
         if not self.lm:
             graph_with_and = pynutil.add_weight(graph, 0.00001)
             not_quote = pynini.closure(NEMO_NOT_QUOTE)
-            no_thousand_million = pynini.difference(
-                not_quote, not_quote + pynini.union("thousand", "million") + not_quote
-            ).optimize()
+            no_thousand_million, no_hundred = _and_insertion_contexts()
             integer = (
                 not_quote + pynutil.add_weight(pynini.cross("hundred ", "hundred and ") + no_thousand_million, -0.0001)
             ).optimize()
 
-            no_hundred = pynini.difference(NEMO_SIGMA, not_quote + pynini.accep("hundred") + not_quote).optimize()
             integer |= (
                 not_quote + pynutil.add_weight(pynini.cross("thousand ", "thousand and ") + no_hundred, -0.0001)
             ).optimize()
@@ -0,0 +1,87 @@
+# Copyright (c) 2025, Kenpath Technologies Pvt Ltd.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Tuple
+
+import pynini
+
+# Number of worker processes building independent taggers, unset to build them in the calling process
+BUILD_WORKERS_ENV = "INDIC_TN_BUILD_WORKERS"
+
+
+def build_workers(num_tasks: int) -> int:
+    """
+    Returns the number of worker processes to build num_tasks graphs in, 0 to build them in this process.
+    Forking a process holding large graphs is opt-in through the INDIC_TN_BUILD_WORKERS environment variable,
+    limited to the CPUs this process may run on, and only done from the main thread, since a child forked
+    while another thread holds a lock (e.g. the logging or cardinal lock) can deadlock.
+
+    Args:
+        num_tasks: number of graphs to build
+    """
+    try:
+        requested = int(os.environ.get(BUILD_WORKERS_ENV, 0))
+    except ValueError:
+        logging.warning(f"Ignoring {BUILD_WORKERS_ENV}={os.environ[BUILD_WORKERS_ENV]}, expected a number of processes")
+        return 0
+    if "fork" not in multiprocessing.get_all_start_methods() or threading.current_thread() is not threading.main_thread():
+        return 0
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 1
+    workers = min(requested, available, num_tasks)
+    return workers if workers > 1 else 0
+
+
+def _timed_build(build_graph: Callable[[str], 'pynini.FstLike'], name: str) -> Tuple['pynini.FstLike', float]:
+    start_time = time.time()
+    graph = build_graph(name)
+    return graph, time.time() - start_time
+
+
+def build_graphs(build_graph: Callable[[str], 'pynini.FstLike'], names: Iterable[str]) -> Dict[str, 'pynini.FstLike']:
+    """
+    Builds independent graphs by name, in forked worker processes if enabled by build_workers, and logs
+    the build time and number of states of each at debug level. Graphs they are built from should be built
+    before, so that the workers inherit them instead of building them again.
+
+    Args:
+        build_graph: function building the graph of a name, a module level function or a functools.partial
+            of one, so that it can be sent to the workers
+        names: names of the graphs to build
+
+    Returns: mapping of name to its graph
+    """
+    names = list(names)
+    workers = build_workers(len(names))
+    if workers:
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("fork")) as executor:
+            results = list(executor.map(_timed_build, [build_graph] * len(names), names))
+    else:
+        results = [_timed_build(build_graph, name) for name in names]
+
+    debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+    graphs = {}
+    for name, (graph, build_time) in zip(names, results):
+        if debug:
+            logging.debug(f"{name}: {build_time:.2f}s -- {graph.num_states()} nodes")
+        graphs[name] = graph
+    return graphs
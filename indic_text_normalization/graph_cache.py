@@ -0,0 +1,139 @@
+# Copyright (c) 2025, Kenpath Technologies Pvt Ltd.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import hashlib
+import logging
+import os
+from typing import Callable, Dict, Iterable, List
+
+import pynini
+from pynini.export import export
+
+from indic_text_normalization import digit_maps
+
+# Default location for compiled grammar caches, see load_or_build()
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "indic_text_normalization")
+# Shared modules every grammar is built with, hashed into each cache key besides the grammar's own files
+CACHE_KEY_MODULES = [__file__, digit_maps.__file__]
+
+# Compiled string files by md5 of their content, so byte-identical files of different languages share one graph
+_string_files: Dict[str, 'pynini.FstLike'] = {}
+
+
+@functools.lru_cache(maxsize=None)
+def load_string_file(path: str) -> 'pynini.FstLike':
+    """
+    Compiles a tsv file with pynini.string_file once per process and returns the optimized graph,
+    arc-sorted on input labels as it is normally the right operand of a composition.
+    The returned graph is shared, so callers must not modify it in place.
+
+    Args:
+        path: absolute path to the tsv file
+    """
+    with open(path, "rb") as f:
+        digest = hashlib.md5(f.read()).hexdigest()
+    if digest not in _string_files:
+        _string_files[digest] = pynini.string_file(path).optimize().arcsort("ilabel")
+    return _string_files[digest]
+
+
+@functools.lru_cache(maxsize=None)
+def load_far_graph(path: str) -> 'pynini.FstLike':
+    """
+    Reads the first graph of a FAR file once per process.
+    The returned graph is shared, so callers must not modify it in place.
+
+    Args:
+        path: absolute path to the FAR file
+    """
+    return pynini.Far(path).get_fst()
+
+
+def get_cache_key(files: List[str], *args, modules: Iterable[str] = ()) -> str:
+    """
+    Returns a short content hash identifying a compiled grammar, used to name its FAR cache file.
+    Besides the given files, the hash covers the shared modules in CACHE_KEY_MODULES.
+    Each language binds modules to its graph_utils module, see e.g. bn.graph_utils.get_cache_key.
+
+    Args:
+        files: grammar source and data files the graph is built from
+        args: any further values the graph depends on, e.g. deterministic
+        modules: further modules of the language the graph is built with
+    """
+    from indic_text_normalization import __version__
+
+    digest = hashlib.sha1(__version__.encode("utf-8"))
+    for file_name in CACHE_KEY_MODULES + list(modules) + list(files):
+        with open(file_name, "rb") as f:
+            digest.update(f.read())
+    digest.update(repr(args).encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def load_or_build(
+    far_file: str, builder: Callable[[], Dict[str, 'pynini.FstLike']]
+) -> Dict[str, 'pynini.FstLike']:
+    """
+    Restores graphs from a FAR file if it exists, otherwise builds them and saves them to the FAR file.
+    An unreadable FAR file, e.g. truncated by a full disk, is deleted and rebuilt.
+    Failing to write the cache is not an error, the built graphs are returned regardless.
+
+    Args:
+        far_file: path to the FAR file
+        builder: function returning a mapping of rule names to graphs
+
+    Returns mapping of rule names to graphs
+    """
+    if os.path.exists(far_file):
+        try:
+            far = pynini.Far(far_file, mode="r")
+            graphs = {}
+            while not far.done():
+                graphs[far.get_key()] = far.get_fst()
+                far.next()
+            logging.debug(f"Restored {', '.join(graphs)} from {far_file}")
+            return graphs
+        except (OSError, pynini.FstOpError) as e:
+            logging.warning(f"Rebuilding unreadable cache {far_file}: {e}")
+            try:
+                os.remove(far_file)
+            except OSError:
+                pass
+
+    graphs = builder()
+    save_far(far_file, graphs)
+    return graphs
+
+
+def save_far(far_file: str, graphs: Dict[str, 'pynini.FstLike']):
+    """
+    Saves graphs to a FAR file atomically, so that concurrent processes never read a partial archive.
+    Failing to write the cache is not an error and is only logged.
+
+    Args:
+        far_file: path to the FAR file
+        graphs: mapping of rule names to graphs
+    """
+    tmp_file = f"{far_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(far_file), exist_ok=True)
+        exporter = export.Exporter(tmp_file)
+        for rule, graph in graphs.items():
+            exporter[rule] = graph.optimize()
+        exporter.close()
+        os.replace(tmp_file, far_file)
+        logging.info(f"Created {far_file}")
+    except OSError as e:
+        logging.warning(f"Could not cache graphs to {far_file}: {e}")
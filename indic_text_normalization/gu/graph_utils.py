@@ -13,6 +13,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 import string
@@ -24,6 +25,8 @@ from pynini import Far
 from pynini.export import export
 from pynini.lib import byte, pynutil, utf8
 
+from indic_text_normalization import graph_cache
+
 NEMO_CHAR = utf8.VALID_UTF8_CHAR
 NEMO_DIGIT = byte.DIGIT
 
@@ -63,6 +66,7 @@ NEMO_SIGMA = pynini.closure(NEMO_CHAR)
 
 delete_space = pynutil.delete(pynini.closure(NEMO_WHITE_SPACE))
 delete_zero_or_one_space = pynutil.delete(pynini.closure(NEMO_WHITE_SPACE, 0, 1))
+accept_zero_or_one_space = pynini.closure(NEMO_SPACE, 0, 1).optimize()
 insert_space = pynutil.insert(" ")
 delete_extra_space = pynini.cross(pynini.closure(NEMO_WHITE_SPACE, 1), " ")
 delete_preserve_order = pynini.closure(
@@ -129,6 +133,10 @@ def generator_main(file_name: str, graphs: Dict[str, 'pynini.FstLike']):
     logging.info(f'Created {file_name}')
 
 
+# Cache key of a graph built with this module, see graph_cache.get_cache_key()
+get_cache_key = functools.partial(graph_cache.get_cache_key, modules=[__file__])
+
+
 def convert_space(fst) -> 'pynini.FstLike':
     """
     Converts space to nonbreaking space.
@@ -12,23 +12,25 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import threading
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.gu.graph_utils import (
     GraphFst,
     NEMO_DIGIT,
     NEMO_GU_DIGIT,
+    get_cache_key,
     insert_space,
 )
 from indic_text_normalization.gu.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
+arabic_to_gujarati_number = arabic_to_native_number(GUJARATI_DIGITS)
 
 # Create a graph that deletes commas from digit sequences
 # This handles Indian number format where commas are separators (e.g., 1,000,001 or 5,67,300)
@@ -40,6 +42,10 @@ delete_commas = (
     + pynini.closure(pynini.closure(pynutil.delete(","), 0, 1) + any_digit)
 ).optimize()
 
+# Gujarati or Arabic digit strings, with the Arabic digits converted to Gujarati digits
+gujarati_digits_input = pynini.closure(NEMO_GU_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_gujarati_number
+gujarati_digits_input = gujarati_digits_input.optimize().arcsort("olabel")
+
 
 class CardinalFst(GraphFst):
     """
@@ -54,6 +60,13 @@ class CardinalFst(GraphFst):
     def __init__(self, deterministic: bool = True, lm: bool = False):
         super().__init__(name="cardinal", kind="classify", deterministic=deterministic)
 
+        data_files = [
+            get_abs_path(f"data/numbers/{name}.tsv")
+            for name in ("digit", "zero", "teens_and_ties", "hundreds_combined", "hundred")
+        ]
+        # Identifies the number graph, for the disk caches of the taggers built from it
+        self.cache_key = get_cache_key([__file__] + data_files, deterministic, lm)
+
         # Load Gujarati number mappings efficiently
         digit = pynini.string_file(get_abs_path("data/numbers/digit.tsv")).optimize()
         zero = pynini.string_file(get_abs_path("data/numbers/zero.tsv")).optimize()
@@ -251,6 +264,8 @@ class CardinalFst(GraphFst):
         )
 
         self.final_graph = final_graph
+        # Other taggers compose their digit inputs with the number graph
+        self.final_graph.arcsort("ilabel")
         final_graph = (
             optional_minus_graph
             + pynutil.insert("integer: \"")
@@ -260,3 +275,57 @@ class CardinalFst(GraphFst):
         final_graph = self.add_tokens(final_graph)
         self.fst = final_graph.optimize()
 
+
+_cardinal_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_cardinal_fst(deterministic: bool, lm: bool) -> CardinalFst:
+    return CardinalFst(deterministic=deterministic, lm=lm)
+
+
+def get_cardinal_fst(deterministic: bool = True, lm: bool = False) -> CardinalFst:
+    """
+    Returns a CardinalFst shared within the process, the graphs are never modified after construction.
+
+    Args:
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+        lm: passed through to CardinalFst
+    """
+    # pynini graph construction is not reentrant, so only one thread builds at a time
+    with _cardinal_lock:
+        return _cached_cardinal_fst(deterministic, lm)
+
+
+def get_number_graph(cardinal: CardinalFst) -> 'pynini.FstLike':
+    """
+    Returns the cardinal reading of Gujarati or Arabic digit strings without commas,
+    composed once per cardinal instance for the taggers reading numbers within expressions.
+    The graph is kept on the cardinal, so that it is released together with it.
+
+    Args:
+        cardinal: CardinalFst
+    """
+    number_graph = getattr(cardinal, "_number_graph", None)
+    if number_graph is None:
+        number_graph = pynini.compose(gujarati_digits_input, cardinal.final_graph).optimize()
+        cardinal._number_graph = number_graph
+    return number_graph
+
+
+def get_digit_sequence_graph(cardinal: CardinalFst) -> 'pynini.FstLike':
+    """
+    Returns the digit-by-digit reading of Gujarati or Arabic digit strings, e.g. of fractional parts,
+    composed once per cardinal instance and kept on it like get_number_graph.
+
+    Args:
+        cardinal: CardinalFst
+    """
+    digit_sequence_graph = getattr(cardinal, "_digit_sequence_graph", None)
+    if digit_sequence_graph is None:
+        digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
+        digit_words = (digit_word_graph + pynini.closure(insert_space + digit_word_graph)).optimize().arcsort("ilabel")
+        digit_sequence_graph = pynini.compose(gujarati_digits_input, digit_words).optimize()
+        cardinal._digit_sequence_graph = digit_sequence_graph
+    return digit_sequence_graph
@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.gu.graph_utils import (
     NEMO_DIGIT,
     NEMO_GU_DIGIT,
@@ -26,11 +27,8 @@ from indic_text_normalization.gu.graph_utils import (
 from indic_text_normalization.gu.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
+arabic_to_gujarati_number = arabic_to_native_number(GUJARATI_DIGITS)
 
 days = pynini.string_file(get_abs_path("data/date/days.tsv"))
 months = pynini.string_file(get_abs_path("data/date/months.tsv"))
@@ -15,17 +15,15 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.gu.graph_utils import GraphFst, NEMO_DIGIT, insert_space
 from indic_text_normalization.gu.utils import get_abs_path
 
 quantities = pynini.string_file(get_abs_path("data/numbers/thousands.tsv"))
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
+arabic_to_gujarati_number = arabic_to_native_number(GUJARATI_DIGITS)
 
 
 def get_quantity(decimal: 'pynini.FstLike', cardinal_up_to_hundred: 'pynini.FstLike') -> 'pynini.FstLike':
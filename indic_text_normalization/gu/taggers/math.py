@@ -12,30 +12,49 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import string
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization import token_fields
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build, load_string_file
 from indic_text_normalization.gu.graph_utils import (
     NEMO_CHAR,
-    NEMO_DIGIT,
-    NEMO_GU_DIGIT,
     NEMO_SPACE,
     GraphFst,
-    insert_space,
+    accept_zero_or_one_space,
+    get_cache_key,
 )
-from indic_text_normalization.gu.utils import get_abs_path
-
-# Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+from indic_text_normalization.gu.taggers.cardinal import get_digit_sequence_graph, get_number_graph
+from indic_text_normalization.gu.utils import get_abs_path, load_labels
+from indic_text_normalization.token_fields import concat, field
 
 # Load math operations and Greek letters
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 greek_letters = pynini.string_file(get_abs_path("data/greek.tsv"))
 
+# Operators that can appear between numbers
+# Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
+OPERATORS = (
+    "+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?", "×", "÷", "√", "≈", "·", "x", "X"
+)
+# Verbalized operators, composed once and shared by all the math patterns (square root included)
+operator_graph = pynini.compose(pynini.union(*OPERATORS).optimize().arcsort("olabel"), math_operations).optimize()
+
+# Characters of an alphabetic operand: anything but an operator, a space, a digit or a Greek letter.
+# 'x' and 'X' stay allowed even though they are operators, so that they also work as variables (e.g. sqrt(x))
+_NON_ALPHA_CHARS = (
+    {op for op in OPERATORS if op not in ("x", "X")}
+    | {NEMO_SPACE}
+    | set(string.digits)
+    | set(GUJARATI_DIGITS)
+    | {row[0] for row in load_labels(get_abs_path("data/greek.tsv"))}
+)
+alpha_char = pynini.difference(NEMO_CHAR, pynini.union(*sorted(_NON_ALPHA_CHARS))).optimize()
+
 
 class MathFst(GraphFst):
     """
@@ -53,227 +72,109 @@ class MathFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="math", kind="classify", deterministic=deterministic)
 
-        cardinal_graph = cardinal.final_graph
-        
+        data_files = [get_abs_path("data/math_operations.tsv"), get_abs_path("data/greek.tsv")]
+        cache_key = get_cache_key([__file__, token_fields.__file__] + data_files, cardinal.cache_key)
+        far_file = os.path.join(CACHE_DIR, f"gu_math_{cache_key}.far")
+        self.fst = load_or_build(far_file, lambda: {"math": self._build_graph(cardinal)})["math"]
+
+    def _build_graph(self, cardinal: GraphFst):
+        """
+        Builds the math graph from the cardinal graph
+        """
         # Support both Gujarati and Arabic digits
-        # Gujarati digits input
-        gujarati_number_input = pynini.closure(NEMO_GU_DIGIT, 1)
-        gujarati_number_graph = pynini.compose(gujarati_number_input, cardinal_graph).optimize()
-        
-        # Arabic digits input
-        arabic_number_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_number_graph = pynini.compose(
-            arabic_number_input,
-            arabic_to_gujarati_number @ cardinal_graph
-        ).optimize()
-        
-        # Combined number graph
-        number_graph = gujarati_number_graph | arabic_number_graph
+        number_graph = get_number_graph(cardinal)
 
         # Decimal support inside math (needed for π equations)
         # Speak fractional digits digit-by-digit and use "દશાંશ" as decimal separator.
-        cardinal_digit_graph = (cardinal.digit | cardinal.zero).optimize()
-        
-        gujarati_frac = pynini.compose(
-            pynini.closure(NEMO_GU_DIGIT, 1),
-            cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph),
-        ).optimize()
-        
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_gujarati_number @ (cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph)),
-        ).optimize()
-        
-        fractional_graph = (gujarati_frac | arabic_frac).optimize()
+        fractional_graph = get_digit_sequence_graph(cardinal)
 
         point = pynutil.delete(".") + pynutil.insert(" દશાંશ ")
         decimal_graph = (number_graph + point + fractional_graph).optimize()
 
-        # Greek letters support
-        greek_graph = greek_letters
-
-        # Square root support moved to operators
-
-        # Operators that can appear between numbers
-        # Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
-        operators = pynini.union("+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", ",", "(", ")", "?", "×", "÷", "√", "≈", "·", "x", "X")
-
-        # Extract just the Greek characters (input side) from the mapping
-        greek_char = pynini.project(greek_letters, "input")
-        
-        # Alpha char should NOT exclude 'x' or 'X' even though they are operators now
-        # because we want to support 'x' as a variable too (e.g. sqrt(x))
-        operators_excluding_x = pynini.difference(operators, pynini.union("x", "X"))
-
-        alpha_char = pynini.difference(
-            NEMO_CHAR, 
-            operators_excluding_x | NEMO_SPACE | NEMO_DIGIT | NEMO_GU_DIGIT | greek_char
-        ).optimize()
         alpha_graph = pynini.closure(alpha_char, 1)
 
         # Operands supported by math expressions
         # Prefer decimals when they match (weight -0.1), otherwise fall back to other types
-        operand_graph = pynutil.add_weight(decimal_graph, -0.1) | number_graph | greek_graph | alpha_graph
+        operand_graph = pynutil.add_weight(decimal_graph, -0.1) | number_graph | greek_letters | alpha_graph
 
         # Optional space around operators
-        optional_space = pynini.closure(NEMO_SPACE, 0, 1)
-        delimiter = optional_space | pynutil.insert(" ")
+        delimiter = accept_zero_or_one_space | pynutil.insert(" ")
         
         # Math expression: number operator number
         # Pattern: number [space] operator [space] number
-        math_expression = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-        )
-
-        # Also support: number operator number operator number (for longer expressions)
-        # This handles cases like "1+2+3" or "π=3.14"
-        extended_math = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("middle: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator_two: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        # Longer expressions such as "1+2+3" or "π=3.14" add a middle operand and a second operator
+        middle_term = concat(field("middle", operand_graph), delimiter, field("operator_two", operator_graph), delimiter)
+        math_expression = concat(
+            field("left", operand_graph),
+            delimiter,
+            field("operator", operator_graph),
+            delimiter,
+            pynini.closure(middle_term, 0, 1),
+            field("right", operand_graph),
         )
 
         # Support: operator number (e.g., "+5", "*3", "√x")
-        operator_number = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-        )
+        operator_number = concat(field("left"), field("operator", operator_graph), delimiter, field("right", operand_graph))
 
         # Support: number operator (e.g., "5+", "3*")
-        number_operator = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-        )
+        number_operator = concat(field("left", operand_graph), delimiter, field("operator", operator_graph), field("right"))
 
         # Support: standalone operator (e.g., "+", "*", "?")
-        standalone_operator = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-        )
+        standalone_operator = concat(field("left"), field("operator", operator_graph), field("right"))
 
         # Special-case: tight dash patterns (similar to Hindi)
         # Use simpler number_graph for tight patterns to avoid complexity issues
-        tight = pynutil.insert("")  # no space
-        
+        minus_from = pynini.cross("-", "થી")
+        equals = pynini.cross("=", "બરાબર")
+
         # Pattern 1: "10-2=8" - tight minus with equals (no spaces)
         # Use number_graph (not operand_graph) for simpler matching
-        math_expression_tight_minus_equals = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "થી")
-            + pynutil.insert("\" ")
-            + pynutil.insert("middle: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "બરાબર")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_equals = concat(
+            field("left", number_graph),
+            " ",
+            field("operator", minus_from),
+            " ",
+            field("middle", number_graph),
+            " ",
+            field("operator_two", equals),
+            " ",
+            field("right", number_graph),
+            " ",
         )
 
         # Pattern 2: "10-2 ગેદેર સંખ્યા" - tight minus followed by text
-        math_expression_tight_minus_text = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "થી")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_text = concat(
+            field("left", number_graph), " ", field("operator", minus_from), " ", field("right", number_graph), " "
         )
 
         # Pattern 3: "10 - 7 = 3" - spaced minus with equals
-        spaced_math_minus_equals = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "બાદબાકી")
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("middle: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "બરાબર")
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        spaced_math_minus_equals = concat(
+            field("left", number_graph),
+            " ",
+            pynutil.delete(" "),
+            field("operator", pynini.cross("-", "બાદબાકી")),
+            " ",
+            pynutil.delete(" "),
+            field("middle", number_graph),
+            " ",
+            pynutil.delete(" "),
+            field("operator_two", equals),
+            " ",
+            pynutil.delete(" "),
+            field("right", number_graph),
+            " ",
         )
 
         # Square root expressions: √2, √3, etc.
         sqrt_symbol = pynini.accep("√")
-        optional_space_after_sqrt = pynini.closure(NEMO_SPACE, 0, 1)
-        sqrt_expression = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross(sqrt_symbol, "વર્ગમૂળ")
-            + pynutil.insert("\" ")
-            + optional_space_after_sqrt
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        sqrt_expression = concat(
+            field("left"),
+            " ",
+            field("operator", pynini.cross(sqrt_symbol, "વર્ગમૂળ")),
+            " ",
+            accept_zero_or_one_space,
+            field("right", number_graph),
+            " ",
         )
 
         final_graph = (
@@ -282,10 +183,9 @@ class MathFst(GraphFst):
             | pynutil.add_weight(spaced_math_minus_equals, -0.18)
             | pynutil.add_weight(math_expression_tight_minus_text, -0.15)
             | math_expression
-            | extended_math
             | operator_number
             | number_operator
             | standalone_operator
         )
         final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph.optimize()
+        return final_graph.optimize()
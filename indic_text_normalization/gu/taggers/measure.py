@@ -16,6 +16,8 @@ import os
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.gu.graph_utils import (
     GU_DODH,
     GU_ADHI,
@@ -38,11 +40,8 @@ from indic_text_normalization.gu.graph_utils import (
 from indic_text_normalization.gu.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
+arabic_to_gujarati_number = arabic_to_native_number(GUJARATI_DIGITS)
 
 GU_POINT_FIVE = ".૫"  # .5
 GU_ONE_POINT_FIVE = "૧.૫"  # 1.5
@@ -381,7 +380,7 @@ class MeasureFst(GraphFst):
         math = None
         try:
             if os.path.exists(math_operations_path):
-                math_operations = pynini.string_file(math_operations_path)
+                math_operations = load_string_file(math_operations_path)
                 delimiter = pynini.accep(" ") | pynutil.insert(" ")
                 
                 math_expr = (
@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit, arabic_to_native_number
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build
 from indic_text_normalization.gu.graph_utils import (
     GraphFst,
     NEMO_DIGIT,
     NEMO_GU_DIGIT,
+    get_cache_key,
     insert_space,
 )
 from indic_text_normalization.gu.utils import get_abs_path
@@ -26,11 +31,8 @@ from indic_text_normalization.gu.utils import get_abs_path
 currency_graph = pynini.string_file(get_abs_path("data/money/currency.tsv"))
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯)
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
-arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
+arabic_to_gujarati_number = arabic_to_native_number(GUJARATI_DIGITS)
 
 # Gujarati suffixes that can follow money amounts
 gujarati_suffixes = pynini.union("ના", "ની", "ને", "નો").optimize()
@@ -54,6 +56,14 @@ class MoneyFst(GraphFst):
     def __init__(self, cardinal: GraphFst):
         super().__init__(name="money", kind="classify")
 
+        cache_key = get_cache_key([__file__, get_abs_path("data/money/currency.tsv")], cardinal.cache_key)
+        far_file = os.path.join(CACHE_DIR, f"gu_money_{cache_key}.far")
+        self.fst = load_or_build(far_file, lambda: {"money": self._build_graph(cardinal)})["money"]
+
+    def _build_graph(self, cardinal: GraphFst):
+        """
+        Builds the money graph from the cardinal graph
+        """
         cardinal_graph = cardinal.final_graph
 
         optional_graph_negative = pynini.closure(
@@ -76,7 +86,7 @@ class MoneyFst(GraphFst):
         
         integer = pynutil.insert('integer_part: "') + number_cardinal + pynutil.insert('"')
         fraction = pynutil.insert('fractional_part: "') + number_cardinal + pynutil.insert('"')
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         # Optional Gujarati suffixes after money amount
         optional_suffix = pynini.closure(pynutil.delete(gujarati_suffixes), 0, 1)
@@ -97,6 +107,4 @@ class MoneyFst(GraphFst):
         graph_currencies = graph_major_only | graph_major_and_minor
 
         graph = graph_currencies.optimize()
-        final_graph = self.add_tokens(graph)
-        self.fst = final_graph
-
+        return self.add_tokens(graph)
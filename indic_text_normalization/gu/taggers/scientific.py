@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
 import pynini
 from pynini.lib import pynutil
 
-from indic_text_normalization.gu.graph_utils import GraphFst, NEMO_DIGIT, NEMO_GU_DIGIT, insert_space
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build
+from indic_text_normalization.gu.graph_utils import (
+    GraphFst,
+    get_cache_key,
+    insert_space,
+)
+from indic_text_normalization.gu.taggers.cardinal import get_digit_sequence_graph, get_number_graph
 
 
 class ScientificFst(GraphFst):
@@ -33,45 +41,23 @@ class ScientificFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="scientific", kind="classify", deterministic=deterministic)
 
-        cardinal_graph = cardinal.final_graph
-        digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
-
-        # Arabic digits -> Gujarati digits
-        arabic_to_gujarati_digit = pynini.string_map(
-            [
-                ("0", "૦"),
-                ("1", "૧"),
-                ("2", "૨"),
-                ("3", "૩"),
-                ("4", "૪"),
-                ("5", "૫"),
-                ("6", "૬"),
-                ("7", "૭"),
-                ("8", "૮"),
-                ("9", "૯"),
-            ]
-        ).optimize()
-        arabic_to_gujarati_number = pynini.closure(arabic_to_gujarati_digit).optimize()
+        cache_key = get_cache_key([__file__], cardinal.cache_key)
+        far_file = os.path.join(CACHE_DIR, f"gu_scientific_{cache_key}.far")
+        self.fst = load_or_build(far_file, lambda: {"scientific": self._build_graph(cardinal)})["scientific"]
 
+    def _build_graph(self, cardinal: GraphFst):
+        """
+        Builds the scientific graph from the cardinal graph
+        """
         # Integer part for mantissa
-        gujarati_int = pynini.compose(pynini.closure(NEMO_GU_DIGIT, 1), cardinal_graph).optimize()
-        arabic_int = pynini.compose(pynini.closure(NEMO_DIGIT, 1), arabic_to_gujarati_number @ cardinal_graph).optimize()
-        integer_graph = (gujarati_int | arabic_int).optimize()
+        integer_graph = get_number_graph(cardinal)
 
         # Fractional digits spoken digit-by-digit
-        gujarati_frac = pynini.compose(
-            pynini.closure(NEMO_GU_DIGIT, 1),
-            digit_word_graph + pynini.closure(insert_space + digit_word_graph),
-        ).optimize()
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_gujarati_number @ (digit_word_graph + pynini.closure(insert_space + digit_word_graph)),
-        ).optimize()
-        fractional_graph = (gujarati_frac | arabic_frac).optimize()
+        fractional_graph = get_digit_sequence_graph(cardinal)
 
         # Decimal point in Gujarati
         point = pynutil.delete(".") + pynutil.insert(" દશાંશ ")
-        mantissa_graph = (integer_graph + point + fractional_graph).optimize()
+        mantissa_graph = integer_graph + point + fractional_graph
 
         # Exponent (integer)
         exponent_graph = integer_graph
@@ -102,4 +88,4 @@ class ScientificFst(GraphFst):
             + pynutil.insert('"')
         )
 
-        self.fst = self.add_tokens(graph).optimize()
+        return self.add_tokens(graph).optimize()
@@ -16,6 +16,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import GUJARATI_DIGITS, arabic_to_native_digit
 from indic_text_normalization.gu.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -46,10 +47,7 @@ credit_context = pynini.string_file(get_abs_path("data/telephone/credit_context.
 pincode_context = pynini.string_file(get_abs_path("data/telephone/pincode_context.tsv"))
 
 # Convert Arabic digits (0-9) to Gujarati digits (૦-૯) for pattern matching
-arabic_to_gujarati_digit = pynini.string_map([
-    ("0", "૦"), ("1", "૧"), ("2", "૨"), ("3", "૩"), ("4", "૪"),
-    ("5", "૫"), ("6", "૬"), ("7", "૭"), ("8", "૮"), ("9", "૯")
-]).optimize()
+arabic_to_gujarati_digit = arabic_to_native_digit(GUJARATI_DIGITS)
 
 # Reusable optimized graph for any digit token
 # Supports both Arabic digits (via digit_to_word) and Gujarati digits (via digits)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 
@@ -26,7 +27,7 @@ from indic_text_normalization.gu.graph_utils import (
     delete_space,
     generator_main,
 )
-from indic_text_normalization.gu.taggers.cardinal import CardinalFst
+from indic_text_normalization.gu.taggers.cardinal import get_cardinal_fst
 from indic_text_normalization.gu.taggers.date import DateFst
 from indic_text_normalization.gu.taggers.decimal import DecimalFst
 from indic_text_normalization.gu.taggers.fraction import FractionFst
@@ -36,6 +37,43 @@ from indic_text_normalization.gu.taggers.punctuation import PunctuationFst
 from indic_text_normalization.gu.taggers.time import TimeFst
 from indic_text_normalization.gu.taggers.whitelist import WhiteListFst
 from indic_text_normalization.gu.taggers.word import WordFst
+from indic_text_normalization.graph_build import build_graphs
+
+# Taggers built only from the cardinal graph, whose instances are not needed by other taggers,
+# so they can be built independently of each other
+CARDINAL_TAGGERS = {
+    "date": lambda cardinal, deterministic: DateFst(cardinal=cardinal),
+    "time": lambda cardinal, deterministic: TimeFst(cardinal=cardinal),
+    "money": lambda cardinal, deterministic: MoneyFst(cardinal=cardinal),
+    "math": lambda cardinal, deterministic: _get_math_fst(cardinal=cardinal, deterministic=deterministic),
+    "power": lambda cardinal, deterministic: _get_power_fst(cardinal=cardinal, deterministic=deterministic),
+    "scientific": lambda cardinal, deterministic: _get_scientific_fst(cardinal=cardinal, deterministic=deterministic),
+}
+
+
+def _get_math_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.gu.taggers.math import MathFst
+
+    return MathFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _get_power_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.gu.taggers.power import PowerFst
+
+    return PowerFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _get_scientific_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.gu.taggers.scientific import ScientificFst
+
+    return ScientificFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _build_tagger_graph(name: str, deterministic: bool):
+    """
+    Builds the graph of one of CARDINAL_TAGGERS
+    """
+    return CARDINAL_TAGGERS[name](get_cardinal_fst(deterministic=deterministic), deterministic).fst
 
 
 class ClassifyFst(GraphFst):
@@ -77,27 +115,29 @@ class ClassifyFst(GraphFst):
         else:
             logging.info(f"Creating ClassifyFst grammars.")
 
-            cardinal = CardinalFst(deterministic=deterministic)
+            cardinal = get_cardinal_fst(deterministic=deterministic)
             cardinal_graph = cardinal.fst
 
+            # built after the cardinal graph, so that forked workers inherit it instead of building it again
+            tagger_graphs = build_graphs(
+                functools.partial(_build_tagger_graph, deterministic=deterministic), CARDINAL_TAGGERS
+            )
+            date_graph = tagger_graphs["date"]
+            time_graph = tagger_graphs["time"]
+            money_graph = tagger_graphs["money"]
+            math_graph = tagger_graphs["math"]
+            power_graph = tagger_graphs["power"]
+            scientific_graph = tagger_graphs["scientific"]
+
             decimal = DecimalFst(cardinal=cardinal, deterministic=deterministic)
             decimal_graph = decimal.fst
 
-            timefst = TimeFst(cardinal=cardinal)
-            time_graph = timefst.fst
-
-            money = MoneyFst(cardinal=cardinal)
-            money_graph = money.fst
-
             ordinal = OrdinalFst(cardinal=cardinal, deterministic=deterministic)
             ordinal_graph = ordinal.fst
 
             fraction = FractionFst(cardinal=cardinal, deterministic=deterministic)
             fraction_graph = fraction.fst
 
-            date = DateFst(cardinal=cardinal)
-            date_graph = date.fst
-
             from indic_text_normalization.gu.taggers.measure import MeasureFst
             measure = MeasureFst(cardinal=cardinal, decimal=decimal, fraction=fraction, deterministic=deterministic)
             measure_graph = measure.fst
@@ -106,19 +146,6 @@ class ClassifyFst(GraphFst):
             telephone = TelephoneFst()
             telephone_graph = telephone.fst
 
-            from indic_text_normalization.gu.taggers.math import MathFst
-            math = MathFst(cardinal=cardinal, deterministic=deterministic)
-            math = MathFst(cardinal=cardinal, deterministic=deterministic)
-            math_graph = math.fst
-
-            from indic_text_normalization.gu.taggers.power import PowerFst
-            power = PowerFst(cardinal=cardinal, deterministic=deterministic)
-            power_graph = power.fst
-
-            from indic_text_normalization.gu.taggers.scientific import ScientificFst
-            scientific = ScientificFst(cardinal=cardinal, deterministic=deterministic)
-            scientific_graph = scientific.fst
-
             from indic_text_normalization.gu.taggers.serial import SerialFst
             serial = SerialFst(cardinal=cardinal, ordinal=ordinal, deterministic=deterministic)
             serial_graph = serial.fst
@@ -44,11 +44,10 @@ class MoneyFst(GraphFst):
     def __init__(self, cardinal: GraphFst):
         super().__init__(name="money", kind="classify")
 
-        cardinal_graph = cardinal.final_graph
-
-        # Cardinal module now internally handles all commas, converting international 
-        # formats to properly formatted digits. We just directly feed parsing to cardinal_graph
-        cardinal_with_commas = cardinal_graph
+        # Cardinal module now internally handles all commas, converting international
+        # formats to properly formatted digits. We just directly feed parsing to cardinal_graph.
+        # Amounts keep a slight negative weight (-0.1) so that money wins over a bare cardinal
+        number = pynutil.add_weight(cardinal.final_graph, -0.1)
 
         optional_graph_negative = pynini.closure(
             pynutil.insert("negative: ") + pynini.cross("-", "\"true\"") + insert_space,
@@ -62,10 +61,9 @@ class MoneyFst(GraphFst):
         # Support spaced currency symbols: "Rs. 500" instead of just "Rs.500"
         optional_space = pynini.closure(pynini.accep(" "), 0, 1)
         
-        # Use cardinal_with_commas (higher priority) to handle numbers with commas, fallback to regular cardinal_graph
-        integer = pynutil.insert('integer_part: "') + (pynutil.add_weight(cardinal_with_commas, -0.1) | cardinal_graph) + pynutil.insert('"')
-        fraction = pynutil.insert('fractional_part: "') + (pynutil.add_weight(cardinal_with_commas, -0.1) | cardinal_graph) + pynutil.insert('"')
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        integer = pynutil.insert('integer_part: "') + number + pynutil.insert('"')
+        fraction = pynutil.insert('fractional_part: "') + number + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         # Add slight negative weight to prioritize consuming "/-" inside money rather than as separate punctuation
         # Also allow optional space before it.
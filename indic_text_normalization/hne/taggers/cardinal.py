@@ -12,18 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import threading
+
 import pynini
 from pynini.lib import pynutil
 
-from indic_text_normalization.hne.graph_utils import GraphFst, NEMO_DIGIT, NEMO_CG_DIGIT, insert_space
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
+from indic_text_normalization.hne.graph_utils import GraphFst, NEMO_DIGIT, NEMO_CG_DIGIT, get_cache_key, insert_space
 from indic_text_normalization.hne.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Chhattisgarhi digits (०-९)
-arabic_to_cg_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 # Create a graph that deletes commas from digit sequences
 # This handles Indian number format where commas are separators (e.g., 1,000,001 or 5,67,300)
@@ -48,6 +48,10 @@ class CardinalFst(GraphFst):
     def __init__(self, deterministic: bool = True, lm: bool = False):
         super().__init__(name="cardinal", kind="classify", deterministic=deterministic)
 
+        data_files = [get_abs_path(f"data/numbers/{name}.tsv") for name in ("digit", "zero", "teens_and_ties")]
+        # Identifies the number graph, for the disk caches of the taggers built from it
+        self.cache_key = get_cache_key([__file__] + data_files, deterministic, lm)
+
         digit = pynini.string_file(get_abs_path("data/numbers/digit.tsv"))
         zero = pynini.string_file(get_abs_path("data/numbers/zero.tsv"))
         teens_ties = pynini.string_file(get_abs_path("data/numbers/teens_and_ties.tsv"))
@@ -378,3 +382,25 @@ class CardinalFst(GraphFst):
         final_graph = optional_minus_graph + pynutil.insert("integer: \"") + self.final_graph + pynutil.insert("\"")
         final_graph = self.add_tokens(final_graph)
         self.fst = final_graph
+
+
+_cardinal_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_cardinal_fst(deterministic: bool, lm: bool) -> CardinalFst:
+    return CardinalFst(deterministic=deterministic, lm=lm)
+
+
+def get_cardinal_fst(deterministic: bool = True, lm: bool = False) -> CardinalFst:
+    """
+    Returns a CardinalFst shared within the process, the graphs are never modified after construction.
+
+    Args:
+        deterministic: if True will provide a single transduction option,
+            for False multiple transduction are generated (used for audio-based normalization)
+        lm: passed through to CardinalFst
+    """
+    # pynini graph construction is not reentrant, so only one thread builds at a time
+    with _cardinal_lock:
+        return _cached_cardinal_fst(deterministic, lm)
@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
 from indic_text_normalization.hne.graph_utils import GraphFst, NEMO_DIGIT, insert_space
 from indic_text_normalization.hne.utils import get_abs_path
 
@@ -62,11 +63,7 @@ class DecimalFst(GraphFst):
         cardinal_graph = cardinal.final_graph
 
         # Convert Arabic digits (0-9) to Chhattisgarhi digits (०-९)
-        arabic_to_cg_digit = pynini.string_map([
-            ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-            ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-        ]).optimize()
-        arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+        arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
         cg_digit_sequence = (graph_digit + pynini.closure(insert_space + graph_digit)).optimize()
         arabic_digit_input = pynini.closure(NEMO_DIGIT, 1)
@@ -12,30 +12,64 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+import string
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization import token_fields
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build, load_string_file
 from indic_text_normalization.hne.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
     NEMO_CG_DIGIT,
     NEMO_SPACE,
     GraphFst,
+    get_cache_key,
     insert_space,
 )
-from indic_text_normalization.hne.utils import get_abs_path
+from indic_text_normalization.hne.utils import get_abs_path, load_labels
+from indic_text_normalization.token_fields import concat, field
 
 # Convert Arabic digits (0-9) to Chhattisgarhi digits (०-९)
-arabic_to_cg_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
+
+# Chhattisgarhi or Arabic digit strings, Arabic digits converted to Chhattisgarhi ones,
+# the left operand of the compositions with the number readings
+cg_digits_input = (
+    pynini.closure(NEMO_CG_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_cg_number
+).optimize().arcsort("olabel")
 
 # Load math operations and Greek letters
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 greek_letters = pynini.string_file(get_abs_path("data/greek.tsv"))
 
+# Operators that can appear between numbers
+# Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
+# Note: commas are handled as punctuation separators to allow long lists.
+OPERATORS = (
+    "+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", "(", ")", "?", "×", "÷", "√", "≈", "·", "x", "X"
+)
+operators = pynini.string_map(OPERATORS).optimize()
+# Verbalized operators, composed once and shared by all the math patterns
+operator_graph = pynini.compose(operators.arcsort("olabel"), math_operations).optimize()
+
+# Simple variable (single letter a-z, A-Z, or x, y etc)
+single_var = pynini.string_map(string.ascii_letters).optimize()
+
+# Characters of an alphabetic operand: anything but an operator, a space, a digit or a Greek letter.
+# 'x' and 'X' stay allowed even though they are operators, so that they also work as variables (e.g. sqrt(x))
+_NON_ALPHA_CHARS = (
+    {op for op in OPERATORS if op not in ("x", "X")}
+    | {NEMO_SPACE}
+    | set(string.digits)
+    | set(DEVANAGARI_DIGITS)
+    | {row[0] for row in load_labels(get_abs_path("data/greek.tsv"))}
+)
+alpha_char = pynini.difference(NEMO_CHAR, pynini.string_map(sorted(_NON_ALPHA_CHARS))).optimize()
+
 
 class MathFst(GraphFst):
     """
@@ -54,38 +88,26 @@ class MathFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="math", kind="classify", deterministic=deterministic)
 
+        data_files = [get_abs_path("data/math_operations.tsv"), get_abs_path("data/greek.tsv")]
+        cache_key = get_cache_key([__file__, token_fields.__file__] + data_files, cardinal.cache_key)
+        far_file = os.path.join(CACHE_DIR, f"hne_math_{cache_key}.far")
+        self.fst = load_or_build(far_file, lambda: {"math": self._build_graph(cardinal)})["math"]
+
+    def _build_graph(self, cardinal: GraphFst):
+        """
+        Builds the math graph from the cardinal graph
+        """
         cardinal_graph = cardinal.final_graph
         
         # Support both Chhattisgarhi and Arabic digits
-        # Chhattisgarhi digits input
-        chhattisgarhi_number_input = pynini.closure(NEMO_CG_DIGIT, 1)
-        chhattisgarhi_number_graph = pynini.compose(chhattisgarhi_number_input, cardinal_graph).optimize()
-        
-        # Arabic digits input
-        arabic_number_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_number_graph = pynini.compose(
-            arabic_number_input,
-            arabic_to_cg_number @ cardinal_graph
-        ).optimize()
-        
-        # Combined number graph
-        number_graph = chhattisgarhi_number_graph | arabic_number_graph
+        number_graph = pynini.compose(cg_digits_input, cardinal_graph).optimize()
 
         # Decimal support inside math (needed for π equations)
         # Speak fractional digits digit-by-digit and use "दशमलव" as decimal separator.
         cardinal_digit_graph = (cardinal.digit | cardinal.zero).optimize()
-        
-        cg_frac = pynini.compose(
-            pynini.closure(NEMO_CG_DIGIT, 1),
-            cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph),
+        fractional_graph = pynini.compose(
+            cg_digits_input, cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph)
         ).optimize()
-        
-        arabic_frac = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1),
-            arabic_to_cg_number @ (cardinal_digit_graph + pynini.closure(insert_space + cardinal_digit_graph)),
-        ).optimize()
-        
-        fractional_graph = (cg_frac | arabic_frac).optimize()
 
         point = pynutil.delete(".") + pynutil.insert(" दशमलव ")
         decimal_graph = (number_graph + point + fractional_graph).optimize()
@@ -93,22 +115,6 @@ class MathFst(GraphFst):
         # Greek letters support
         greek_graph = greek_letters
 
-        # Operators that can appear between numbers
-        # Added: × (times), ÷ (divide), √ (sqrt), ≈ (approx), · (dot product), x/X (multiplication)
-        # Note: commas are handled as punctuation separators to allow long lists.
-        operators = pynini.union("+", "-", "*", "=", "&", "^", "%", "$", "#", "@", "!", "<", ">", "(", ")", "?", "×", "÷", "√", "≈", "·", "x", "X")
-
-        # Extract just the Greek characters (input side) from the mapping
-        greek_char = pynini.project(greek_letters, "input")
-        
-        # Alpha char should NOT exclude 'x' or 'X' even though they are operators now
-        # because we want to support 'x' as a variable too (e.g. sqrt(x))
-        operators_excluding_x = pynini.difference(operators, pynini.union("x", "X"))
-
-        alpha_char = pynini.difference(
-            NEMO_CHAR, 
-            operators_excluding_x | NEMO_SPACE | NEMO_DIGIT | NEMO_CG_DIGIT | greek_char
-        ).optimize()
         alpha_graph = pynini.closure(alpha_char, 1)
 
         # Operands supported by math expressions
@@ -121,143 +127,85 @@ class MathFst(GraphFst):
         
         # Math expression: number operator number
         # Pattern: number [space] operator [space] number
-        math_expression = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        math_expression = concat(
+            field("left", operand_graph),
+            delimiter,
+            field("operator", operator_graph),
+            delimiter,
+            field("right", operand_graph),
         )
 
         # Also support: number operator number operator number (for longer expressions)
         # This handles cases like "1+2+3" or "π=3.14"
-        extended_math = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("middle: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator_two: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        extended_math = concat(
+            field("left", operand_graph),
+            delimiter,
+            field("operator", operator_graph),
+            delimiter,
+            field("middle", operand_graph),
+            delimiter,
+            field("operator_two", operator_graph),
+            delimiter,
+            field("right", operand_graph),
         )
 
         # Support: operator number (e.g., "+5", "*3", "√x")
-        operator_number = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("right: \"")
-            + operand_graph
-            + pynutil.insert("\"")
+        operator_number = concat(
+            field("left"), field("operator", operator_graph), delimiter, field("right", operand_graph)
         )
 
         # Support: number operator (e.g., "5+", "3*")
-        number_operator = (
-            pynutil.insert("left: \"")
-            + operand_graph
-            + pynutil.insert("\"")
-            + delimiter
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
+        number_operator = concat(
+            field("left", operand_graph), delimiter, field("operator", operator_graph), field("right")
         )
 
         # Support: standalone operator (e.g., "+", "*", "?")
-        standalone_operator = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\"")
-            + pynutil.insert("right: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\"")
-        )
+        standalone_operator = concat(field("left"), field("operator", operator_graph), field("right"))
 
         # Special-case: tight dash patterns (similar to Hindi)
         # Use simpler number_graph for tight patterns to avoid complexity issues
-        tight = pynutil.insert("")  # no space
-        
+
         # Pattern 1: "10-2=8" - tight minus with equals (no spaces)
         # Use number_graph (not operand_graph) for simpler matching
-        math_expression_tight_minus_equals = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "से")
-            + pynutil.insert("\" ")
-            + pynutil.insert("middle: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "बराबर")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_equals = concat(
+            field("left", number_graph),
+            " ",
+            field("operator", pynini.cross("-", "से")),
+            " ",
+            field("middle", number_graph),
+            " ",
+            field("operator_two", pynini.cross("=", "बराबर")),
+            " ",
+            field("right", number_graph),
+            " ",
         )
 
         # Pattern 2: "10-2 बड़ी संख्या" - tight minus followed by text
-        math_expression_tight_minus_text = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "से")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        math_expression_tight_minus_text = concat(
+            field("left", number_graph),
+            " ",
+            field("operator", pynini.cross("-", "से")),
+            " ",
+            field("right", number_graph),
+            " ",
         )
 
         # Pattern 3: "10 - 7 = 3" - spaced minus with equals
-        spaced_math_minus_equals = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross("-", "घटाव")
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("middle: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("operator_two: \"")
-            + pynini.cross("=", "बराबर")
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("right: \"")
-            + number_graph
-            + pynutil.insert("\" ")
+        spaced_math_minus_equals = concat(
+            field("left", number_graph),
+            " ",
+            pynutil.delete(" "),
+            field("operator", pynini.cross("-", "घटाव")),
+            " ",
+            pynutil.delete(" "),
+            field("middle", number_graph),
+            " ",
+            pynutil.delete(" "),
+            field("operator_two", pynini.cross("=", "बराबर")),
+            " ",
+            pynutil.delete(" "),
+            field("right", number_graph),
+            " ",
         )
 
         # Square root expressions: √2, √3, √x, √ x, etc.
@@ -265,81 +213,50 @@ class MathFst(GraphFst):
         # Accept optional space after sqrt (keeps it in output, verbalizer handles spacing)
         optional_space_sqrt = pynini.closure(pynutil.delete(NEMO_SPACE), 0, 1)
         
-        # Simple variable (single letter a-z, A-Z, or x, y etc)
-        single_var = pynini.union(*"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ")
-        
         # Combined sqrt operand: number, single variable, or Greek letter
         sqrt_operand = number_graph | single_var | greek_graph
         
         # Basic sqrt expression: √2, √ 2, √x, √ x, √π, √ λ
-        sqrt_expression = (
-            pynutil.insert("left: \"")
-            + pynutil.insert("")
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynini.cross(sqrt_symbol, "वर्गमूळ")
-            + pynutil.insert("\" ")
-            + optional_space_sqrt
-            + pynutil.insert("right: \"")
-            + sqrt_operand
-            + pynutil.insert("\" ")
+        sqrt_expression = concat(
+            field("left"),
+            " ",
+            field("operator", pynini.cross(sqrt_symbol, "वर्गमूळ")),
+            " ",
+            optional_space_sqrt,
+            field("right", sqrt_operand),
+            " ",
         )
         
         # Sqrt followed by spaced operator: √ x - 3, √2 - 2 (spaces around operator)
-        sqrt_with_spaced_operation = (
-            pynutil.insert("left: \"")
-            + pynini.cross(sqrt_symbol, "वर्गमूळ ")
-            + optional_space_sqrt
-            + sqrt_operand
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + pynutil.delete(" ")
-            + pynutil.insert("right: \"")
-            + sqrt_operand
-            + pynutil.insert("\" ")
+        sqrt_with_spaced_operation = concat(
+            field("left", pynini.cross(sqrt_symbol, "वर्गमूळ ") + optional_space_sqrt + sqrt_operand),
+            " ",
+            pynutil.delete(" "),
+            field("operator", operator_graph),
+            " ",
+            pynutil.delete(" "),
+            field("right", sqrt_operand),
+            " ",
         )
         
         # Sqrt followed by tight operator: √2-2 (no spaces at all)
-        sqrt_with_tight_operation = (
-            pynutil.insert("left: \"")
-            + pynini.cross(sqrt_symbol, "वर्गमूळ ")
-            + sqrt_operand
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + (operators @ math_operations)
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + sqrt_operand
-            + pynutil.insert("\" ")
+        sqrt_with_tight_operation = concat(
+            field("left", pynini.cross(sqrt_symbol, "वर्गमूळ ") + sqrt_operand),
+            " ",
+            field("operator", operator_graph),
+            " ",
+            field("right", sqrt_operand),
+            " ",
         )
 
         # Implicit multiplication: 2x -> "दुई गुना x", 3y -> "तीन गुना y"
-        implicit_mult = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynutil.insert("गुना")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + single_var
-            + pynutil.insert("\" ")
+        implicit_mult = concat(
+            field("left", number_graph), " ", field("operator", pynutil.insert("गुना")), " ", field("right", single_var), " "
         )
         
         # Implicit multiplication with Greek: 2π -> "दुई गुना पाई"
-        implicit_mult_greek = (
-            pynutil.insert("left: \"")
-            + number_graph
-            + pynutil.insert("\" ")
-            + pynutil.insert("operator: \"")
-            + pynutil.insert("गुना")
-            + pynutil.insert("\" ")
-            + pynutil.insert("right: \"")
-            + greek_graph
-            + pynutil.insert("\" ")
+        implicit_mult_greek = concat(
+            field("left", number_graph), " ", field("operator", pynutil.insert("गुना")), " ", field("right", greek_graph), " "
         )
 
         final_graph = (
@@ -358,4 +275,4 @@ class MathFst(GraphFst):
             | standalone_operator
         )
         final_graph = self.add_tokens(final_graph)
-        self.fst = final_graph.optimize()
+        return final_graph.optimize()
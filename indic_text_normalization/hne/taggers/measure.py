@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
 from indic_text_normalization.hne.graph_utils import (
     CG_DEDH,
     CG_DHAI,
@@ -31,11 +32,7 @@ from indic_text_normalization.hne.graph_utils import (
 from indic_text_normalization.hne.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Chhattisgarhi digits (०-९)
-arabic_to_cg_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 CG_POINT_FIVE = ".५"  # .5
 CG_ONE_POINT_FIVE = "१.५"  # 1.5
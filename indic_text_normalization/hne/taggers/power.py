@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
 from indic_text_normalization.hne.graph_utils import (
     GraphFst,
     NEMO_DIGIT,
@@ -49,12 +50,7 @@ class PowerFst(GraphFst):
         cg_base = pynini.compose(cg_base_input, cardinal_graph).optimize()
         
         arabic_base_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_to_cg = pynini.closure(
-            pynini.string_map([
-                ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-                ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-            ])
-        ).optimize()
+        arabic_to_cg = arabic_to_native_number(DEVANAGARI_DIGITS)
         arabic_base = pynini.compose(arabic_base_input, arabic_to_cg @ cardinal_graph).optimize()
         
         base_number = cg_base | arabic_base
@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
 from indic_text_normalization.hne.graph_utils import GraphFst, NEMO_DIGIT, NEMO_CG_DIGIT, insert_space
 
 
@@ -37,21 +38,7 @@ class ScientificFst(GraphFst):
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
 
         # Arabic digits -> Chhattisgarhi digits
-        arabic_to_cg_digit = pynini.string_map(
-            [
-                ("0", "०"),
-                ("1", "१"),
-                ("2", "२"),
-                ("3", "३"),
-                ("4", "४"),
-                ("5", "५"),
-                ("6", "६"),
-                ("7", "७"),
-                ("8", "८"),
-                ("9", "९"),
-            ]
-        ).optimize()
-        arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+        arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
         # Integer part for mantissa
         cg_int = pynini.compose(pynini.closure(NEMO_CG_DIGIT, 1), cardinal_graph).optimize()
@@ -13,9 +13,12 @@
 # limitations under the License.
 
 
+import os
+
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.graph_cache import CACHE_DIR, load_or_build
 from indic_text_normalization.hne.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -24,6 +27,7 @@ from indic_text_normalization.hne.graph_utils import (
     NEMO_WHITE_SPACE,
     GraphFst,
     delete_space,
+    get_cache_key,
     insert_space,
 )
 from indic_text_normalization.hne.utils import get_abs_path
@@ -212,6 +216,26 @@ class TelephoneFst(GraphFst):
     def __init__(self):
         super().__init__(name="telephone", kind="classify")
 
+        data_files = [
+            get_abs_path(f"data/{name}.tsv")
+            for name in (
+                "telephone/number",
+                "numbers/digit",
+                "numbers/zero",
+                "telephone/mobile_context",
+                "telephone/landline_context",
+                "telephone/credit_context",
+                "telephone/pincode_context",
+            )
+        ]
+        far_file = os.path.join(CACHE_DIR, f"hne_telephone_{get_cache_key([__file__] + data_files)}.far")
+        self.final = load_or_build(far_file, lambda: {"telephone": self._build_graph()})["telephone"]
+        self.fst = self.add_tokens(self.final)
+
+    def _build_graph(self):
+        """
+        Builds the telephone graph of mobile, landline, credit card and pincode numbers
+        """
         mobile_number = generate_mobile(mobile_context)
         landline = generate_landline(landline_context)
         credit_card = generate_credit(credit_context)
@@ -224,5 +248,4 @@ class TelephoneFst(GraphFst):
             | pynutil.add_weight(pincode, 1)
         )
 
-        self.final = graph.optimize()
-        self.fst = self.add_tokens(self.final)
+        return graph.optimize()
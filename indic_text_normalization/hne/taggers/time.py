@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import DEVANAGARI_DIGITS, arabic_to_native_number
 from indic_text_normalization.hne.graph_utils import (
     CG_DEDH,
     CG_DHAI,
@@ -41,11 +42,7 @@ AR_TIME_THIRTY = ":30"
 AR_TIME_FORTYFIVE = ":45"
 
 # Convert Arabic digits (0-9) to Chhattisgarhi digits (०-९)
-arabic_to_cg_digit = pynini.string_map([
-    ("0", "०"), ("1", "१"), ("2", "२"), ("3", "३"), ("4", "४"),
-    ("5", "५"), ("6", "६"), ("7", "७"), ("8", "८"), ("9", "९")
-]).optimize()
-arabic_to_cg_number = pynini.closure(arabic_to_cg_digit).optimize()
+arabic_to_cg_number = arabic_to_native_number(DEVANAGARI_DIGITS)
 
 hours_graph = pynini.string_file(get_abs_path("data/time/hours.tsv"))
 minutes_graph = pynini.string_file(get_abs_path("data/time/minutes.tsv"))
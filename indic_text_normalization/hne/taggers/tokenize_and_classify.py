@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import logging
 import os
 
@@ -31,7 +32,7 @@ from indic_text_normalization.hne.graph_utils import (
     delete_space,
     generator_main,
 )
-from indic_text_normalization.hne.taggers.cardinal import CardinalFst
+from indic_text_normalization.hne.taggers.cardinal import get_cardinal_fst
 from indic_text_normalization.hne.taggers.date import DateFst
 from indic_text_normalization.hne.taggers.decimal import DecimalFst
 from indic_text_normalization.hne.taggers.fraction import FractionFst
@@ -43,8 +44,89 @@ from indic_text_normalization.hne.taggers.telephone import TelephoneFst
 from indic_text_normalization.hne.taggers.time import TimeFst
 from indic_text_normalization.hne.taggers.whitelist import WhiteListFst
 from indic_text_normalization.hne.taggers.word import WordFst
-from indic_text_normalization.hne.taggers.power import PowerFst
-from indic_text_normalization.hne.taggers.scientific import ScientificFst
+from indic_text_normalization.graph_build import build_graphs
+
+# Devanagari character block (used by Chhattisgarhi)
+_CG_BLOCK = pynini.string_map([chr(i) for i in range(0x0900, 0x0980)]).optimize()
+# Characters that are part of numbers
+_ALL_DIGITS = pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT).optimize()
+_NON_DIGIT = pynini.difference(NEMO_NOT_SPACE, _ALL_DIGITS).optimize()
+_MATH_SYMBOLS = pynini.string_map(["√", "∑", "∏", "∫", "∬", "∭", "∮", "∂", "∇"]).optimize()
+# Characters separated from a preceding math symbol
+_FOLLOWING = pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT, NEMO_ALPHA).optimize()
+
+
+# Taggers built only from the cardinal graph, whose instances are not needed by other taggers,
+# so they can be built independently of each other
+CARDINAL_TAGGERS = {
+    "date": lambda cardinal, deterministic: DateFst(cardinal=cardinal),
+    "time": lambda cardinal, deterministic: TimeFst(cardinal=cardinal),
+    "money": lambda cardinal, deterministic: MoneyFst(cardinal=cardinal),
+    "math": lambda cardinal, deterministic: _get_math_fst(cardinal=cardinal, deterministic=deterministic),
+    "power": lambda cardinal, deterministic: _get_power_fst(cardinal=cardinal, deterministic=deterministic),
+    "scientific": lambda cardinal, deterministic: _get_scientific_fst(cardinal=cardinal, deterministic=deterministic),
+}
+
+
+def _get_math_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.hne.taggers.math import MathFst
+
+    return MathFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _get_power_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.hne.taggers.power import PowerFst
+
+    return PowerFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _get_scientific_fst(cardinal: GraphFst, deterministic: bool) -> GraphFst:
+    from indic_text_normalization.hne.taggers.scientific import ScientificFst
+
+    return ScientificFst(cardinal=cardinal, deterministic=deterministic)
+
+
+def _build_tagger_graph(name: str, deterministic: bool):
+    """
+    Builds the graph of one of CARDINAL_TAGGERS
+    """
+    return CARDINAL_TAGGERS[name](get_cardinal_fst(deterministic=deterministic), deterministic).fst
+
+
+@functools.lru_cache(maxsize=1)
+def _build_preprocess_fst():
+    """
+    Builds the rewrite rules for mathematical symbols and special characters applied to the input
+    before tagging, composed into a single graph. They do not depend on any ClassifyFst argument,
+    so they are built once per process.
+    """
+    # Rewrite joiner hyphens between digits and Devanagari letters to spaces
+    # Example: "3.14-अंगु" -> "3.14 अंगु"
+    joiner_hyphen_to_space = pynini.cdrewrite(pynini.cross("-", " "), _ALL_DIGITS, _CG_BLOCK, NEMO_SIGMA)
+
+    # Ensure glued equals patterns like "π=3.1415" tokenize cleanly
+    # Only apply when the left side is NOT a digit (so we don't change "10-2=8" tight math behavior)
+    equals_to_spaced = pynini.cdrewrite(pynini.cross("=", " = "), _NON_DIGIT, _ALL_DIGITS, NEMO_SIGMA)
+
+    # Separate em-dash glued to a following number, e.g. "—3.14"
+    emdash_to_spaced = pynini.cdrewrite(pynini.cross("—", "— "), "", _ALL_DIGITS, NEMO_SIGMA)
+
+    # Convert em-dash used as a joiner between digits and Devanagari letters into a space
+    emdash_joiner_to_space = pynini.cdrewrite(pynini.cross("—", " "), _ALL_DIGITS, _CG_BLOCK, NEMO_SIGMA)
+
+    # Insert space between mathematical symbols (√, ∑, ∫, etc.) and following digits/letters
+    # Example: "√2" -> "√ 2", "∑x" -> "∑ x"
+    math_symbol_to_spaced = pynini.cdrewrite(pynutil.insert(" "), _MATH_SYMBOLS, _FOLLOWING, NEMO_SIGMA)
+
+    preprocess = (
+        math_symbol_to_spaced
+        @ emdash_joiner_to_space
+        @ emdash_to_spaced
+        @ equals_to_spaced
+        @ joiner_hyphen_to_space
+    ).optimize()
+    # Sorted on output labels as the left operand of the composition with the tagger graph
+    return preprocess.arcsort("olabel")
 
 
 class ClassifyFst(GraphFst):
@@ -86,40 +168,32 @@ class ClassifyFst(GraphFst):
         else:
             logging.info(f"Creating ClassifyFst grammars.")
 
-            cardinal = CardinalFst(deterministic=deterministic)
+            cardinal = get_cardinal_fst(deterministic=deterministic)
             cardinal_graph = cardinal.fst
 
+            # built after the cardinal graph, so that forked workers inherit it instead of building it again
+            tagger_graphs = build_graphs(
+                functools.partial(_build_tagger_graph, deterministic=deterministic), CARDINAL_TAGGERS
+            )
+            date_graph = tagger_graphs["date"]
+            time_graph = tagger_graphs["time"]
+            money_graph = tagger_graphs["money"]
+            math_graph = tagger_graphs["math"]
+            power_graph = tagger_graphs["power"]
+            scientific_graph = tagger_graphs["scientific"]
+
             decimal = DecimalFst(cardinal=cardinal, deterministic=deterministic)
             decimal_graph = decimal.fst
 
             fraction = FractionFst(cardinal=cardinal, deterministic=deterministic)
             fraction_graph = fraction.fst
 
-            date = DateFst(cardinal=cardinal)
-            date_graph = date.fst
-
-            timefst = TimeFst(cardinal=cardinal)
-            time_graph = timefst.fst
-
             measure = MeasureFst(cardinal=cardinal, decimal=decimal)
             measure_graph = measure.fst
 
-            money = MoneyFst(cardinal=cardinal)
-            money_graph = money.fst
-
             ordinal = OrdinalFst(cardinal=cardinal, deterministic=deterministic)
             ordinal_graph = ordinal.fst
 
-            from indic_text_normalization.hne.taggers.math import MathFst
-            math = MathFst(cardinal=cardinal, deterministic=deterministic)
-            math_graph = math.fst
-
-            power = PowerFst(cardinal=cardinal, deterministic=deterministic)
-            power_graph = power.fst
-
-            scientific = ScientificFst(cardinal=cardinal, deterministic=deterministic)
-            scientific_graph = scientific.fst
-
             whitelist_graph = WhiteListFst(
                 input_case=input_case, deterministic=deterministic, input_file=whitelist
             ).fst
@@ -176,45 +250,7 @@ class ClassifyFst(GraphFst):
             graph = delete_space + graph + delete_space
             graph = pynini.union(graph, punct)
 
-            # Pre-processing rewrite rules for mathematical symbols and special characters
-            # Devanagari character block (used by Chhattisgarhi)
-            cg_block = pynini.union(*[chr(i) for i in range(0x0900, 0x0980)]).optimize()
-            left_ctx = pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT).optimize()
-            right_ctx = cg_block
-
-            # Rewrite joiner hyphens between digits and Devanagari letters to spaces
-            # Example: "3.14-अंगु" -> "3.14 अंगु"
-            joiner_hyphen_to_space = pynini.cdrewrite(pynini.cross("-", " "), left_ctx, right_ctx, NEMO_SIGMA)
-
-            # Ensure glued equals patterns like "π=3.1415" tokenize cleanly
-            # Only apply when the left side is NOT a digit (so we don't change "10-2=8" tight math behavior)
-            non_digit_left = pynini.difference(
-                NEMO_NOT_SPACE, pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT)
-            ).optimize()
-            digit_right = pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT).optimize()
-            equals_to_spaced = pynini.cdrewrite(pynini.cross("=", " = "), non_digit_left, digit_right, NEMO_SIGMA)
-
-            # Separate em-dash glued to a following number, e.g. "—3.14"
-            emdash_to_spaced = pynini.cdrewrite(pynini.cross("—", "— "), "", digit_right, NEMO_SIGMA)
-
-            # Convert em-dash used as a joiner between digits and Devanagari letters into a space
-            emdash_joiner_to_space = pynini.cdrewrite(pynini.cross("—", " "), digit_right, cg_block, NEMO_SIGMA)
-
-
-            # Insert space between mathematical symbols (√, ∑, ∫, etc.) and following digits/letters
-            # Example: "√2" -> "√ 2", "∑x" -> "∑ x"
-            math_symbols = pynini.union("√", "∑", "∏", "∫", "∬", "∭", "∮", "∂", "∇").optimize()
-            following_char = pynini.union(NEMO_DIGIT, NEMO_CG_DIGIT, NEMO_ALPHA).optimize()
-            math_symbol_to_spaced = pynini.cdrewrite(pynutil.insert(" "), math_symbols, following_char, NEMO_SIGMA)
-
-            self.fst = (
-                math_symbol_to_spaced
-                @ emdash_joiner_to_space
-                @ emdash_to_spaced
-                @ equals_to_spaced
-                @ joiner_hyphen_to_space
-                @ graph
-            ).optimize()
+            self.fst = (_build_preprocess_fst() @ graph).optimize()
 
             if far_file:
                 generator_main(far_file, {"tokenize_and_classify": self.fst})
@@ -15,15 +15,13 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_KN_DIGIT, insert_space
 from indic_text_normalization.kn.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Kannada digits (೦-೯)
-arabic_to_kannada_digit = pynini.string_map([
-    ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-    ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-]).optimize()
-arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+arabic_to_kannada_digit = arabic_to_native_digit(KANNADA_DIGITS)
+arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
 # Delete commas inside digit sequences (e.g., 1,000,001 or ೧,೦೦೦,೦೦೧)
 any_digit = pynini.union(NEMO_DIGIT, NEMO_KN_DIGIT).optimize()
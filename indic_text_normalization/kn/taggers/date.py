@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import (
     NEMO_KN_DIGIT,
     NEMO_KN_NON_ZERO,
@@ -61,11 +62,7 @@ class DateFst(GraphFst):
         from indic_text_normalization.kn.graph_utils import NEMO_DIGIT
         
         # Convert Arabic digits to Kannada for dates
-        arabic_to_kannada_digit = pynini.string_map([
-            ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-            ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-        ]).optimize()
-        arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+        arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
         # Support both Kannada and Arabic digits for year patterns
         kannada_year_thousands = pynini.compose(
@@ -15,7 +15,8 @@
 import pynini
 from pynini.lib import pynutil
 
-from indic_text_normalization.kn.graph_utils import GraphFst, insert_space
+from indic_text_normalization.kn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_KN_DIGIT, insert_space
+from indic_text_normalization.kn.taggers.cardinal import arabic_to_kannada_number
 from indic_text_normalization.kn.utils import get_abs_path
 
 quantities = pynini.string_file(get_abs_path("data/numbers/thousands.tsv"))
@@ -58,25 +59,14 @@ class DecimalFst(GraphFst):
     def __init__(self, cardinal: GraphFst, deterministic: bool = True):
         super().__init__(name="decimal", kind="classify", deterministic=deterministic)
 
-        from indic_text_normalization.kn.graph_utils import NEMO_DIGIT
-        
-        # Convert Arabic digits to Kannada for decimal parts
-        arabic_to_kannada_digit = pynini.string_map([
-            ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-            ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-        ]).optimize()
-        arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
-
         graph_digit = cardinal.digit | cardinal.zero
         cardinal_graph = cardinal.final_graph
 
-        # Support both Kannada and Arabic digits for fractional part
-        kannada_fractional = graph_digit + pynini.closure(insert_space + graph_digit)
-        arabic_fractional = pynini.compose(
-            pynini.closure(NEMO_DIGIT, 1) + pynini.closure(NEMO_DIGIT),
-            arabic_to_kannada_number @ (graph_digit + pynini.closure(insert_space + graph_digit))
-        )
-        self.graph = (kannada_fractional | arabic_fractional).optimize()
+        # Support both Kannada and Arabic digits for fractional part, Arabic digits are converted to Kannada ones
+        fractional_input = pynini.closure(NEMO_KN_DIGIT, 1) | pynini.closure(NEMO_DIGIT, 1) @ arabic_to_kannada_number
+        self.graph = pynini.compose(
+            fractional_input.optimize().arcsort("olabel"), graph_digit + pynini.closure(insert_space + graph_digit)
+        ).optimize()
 
         point = pynutil.delete(".")
 
@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import (
     KN_DEDH,
     KN_DHAI,
@@ -52,11 +53,7 @@ class FractionFst(GraphFst):
         from indic_text_normalization.kn.graph_utils import NEMO_DIGIT
         
         # Convert Arabic digits to Kannada for fractions
-        arabic_to_kannada_digit = pynini.string_map([
-            ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-            ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-        ]).optimize()
-        arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+        arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
         # Support both Kannada and Arabic digits
         kannada_cardinal_graph = cardinal.final_graph
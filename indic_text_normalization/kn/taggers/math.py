@@ -15,6 +15,8 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_number
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.kn.graph_utils import (
     NEMO_DIGIT,
     NEMO_KN_DIGIT,
@@ -25,14 +27,10 @@ from indic_text_normalization.kn.graph_utils import (
 from indic_text_normalization.kn.utils import get_abs_path
 
 # Convert Arabic digits (0-9) to Kannada digits (೦-೯)
-arabic_to_kannada_digit = pynini.string_map([
-    ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-    ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-]).optimize()
-arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
 # Load math operations
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
 
 class MathFst(GraphFst):
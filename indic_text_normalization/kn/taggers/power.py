@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import (
     GraphFst,
     NEMO_DIGIT,
@@ -49,12 +50,7 @@ class PowerFst(GraphFst):
         kannada_base = pynini.compose(kannada_base_input, cardinal_graph).optimize()
         
         arabic_base_input = pynini.closure(NEMO_DIGIT, 1)
-        arabic_to_kannada = pynini.closure(
-            pynini.string_map([
-                ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-                ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-            ])
-        ).optimize()
+        arabic_to_kannada = arabic_to_native_number(KANNADA_DIGITS)
         arabic_base = pynini.compose(arabic_base_input, arabic_to_kannada @ cardinal_graph).optimize()
         
         base_number = kannada_base | arabic_base
@@ -5,6 +5,7 @@ import pynini
 from pynini.examples import plurals
 from pynini.lib import pynutil
 
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.kn.graph_utils import NEMO_NOT_SPACE, NEMO_SIGMA, GraphFst
 from indic_text_normalization.kn.utils import get_abs_path
 
@@ -36,7 +37,7 @@ class PunctuationFst(GraphFst):
         punct = pynini.closure(punct, 1)
 
         # Verbalize "=" everywhere (not only inside MathFst) using the shared math operator mapping.
-        math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+        math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
         equals_spoken = pynini.union("=") @ math_operations
         punct = plurals._priority_union(equals_spoken, punct, NEMO_SIGMA)
 
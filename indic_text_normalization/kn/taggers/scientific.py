@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import GraphFst, NEMO_DIGIT, NEMO_KN_DIGIT, insert_space
 
 
@@ -37,21 +38,7 @@ class ScientificFst(GraphFst):
         digit_word_graph = (cardinal.digit | cardinal.zero).optimize()
 
         # Arabic digits -> Kannada digits
-        arabic_to_kannada_digit = pynini.string_map(
-            [
-                ("0", "೦"),
-                ("1", "೧"),
-                ("2", "೨"),
-                ("3", "೩"),
-                ("4", "೪"),
-                ("5", "೫"),
-                ("6", "೬"),
-                ("7", "೭"),
-                ("8", "೮"),
-                ("9", "೯"),
-            ]
-        ).optimize()
-        arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+        arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
         # Integer part for mantissa
         kannada_int = pynini.compose(pynini.closure(NEMO_KN_DIGIT, 1), cardinal_graph).optimize()
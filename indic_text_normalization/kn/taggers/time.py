@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.digit_maps import KANNADA_DIGITS, arabic_to_native_digit, arabic_to_native_number
 from indic_text_normalization.kn.graph_utils import (
     KN_DEDH,
     KN_DHAI,
@@ -41,10 +42,7 @@ AR_TIME_THIRTY = ":30"
 AR_TIME_FORTYFIVE = ":45"
 
 # Convert Arabic digits (0-9) to Kannada digits (೦-೯)
-arabic_to_kannada_digit = pynini.string_map([
-    ("0", "೦"), ("1", "೧"), ("2", "೨"), ("3", "೩"), ("4", "೪"),
-    ("5", "೫"), ("6", "೬"), ("7", "೭"), ("8", "೮"), ("9", "೯")
-]).optimize()
+arabic_to_kannada_digit = arabic_to_native_digit(KANNADA_DIGITS)
 
 # Create a converter for exactly 2 digits (for minutes/seconds)
 # This ensures "40" -> "೪೦" (exactly 2 digits)
@@ -53,7 +51,7 @@ arabic_to_kannada_two_digits = (
 ).optimize()
 
 # For hours (1-2 digits), use closure
-arabic_to_kannada_number = pynini.closure(arabic_to_kannada_digit).optimize()
+arabic_to_kannada_number = arabic_to_native_number(KANNADA_DIGITS)
 
 hours_graph = pynini.string_file(get_abs_path("data/time/hours.tsv"))
 minutes_graph = pynini.string_file(get_abs_path("data/time/minutes.tsv"))
@@ -49,7 +49,7 @@ class MoneyFst(GraphFst):
         currency_major = pynutil.insert('currency_maj: "') + currency_graph + pynutil.insert('"')
         integer = pynutil.insert('integer_part: "') + cardinal_graph + pynutil.insert('"')
         fraction = pynutil.insert('fractional_part: "') + cardinal_graph + pynutil.insert('"')
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
 
         graph_major_only = optional_graph_negative + currency_major + insert_space + integer
         graph_major_and_minor = (
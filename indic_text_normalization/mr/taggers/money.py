@@ -59,7 +59,7 @@ class MoneyFst(GraphFst):
             + (pynutil.add_weight(cardinal_with_commas, -0.1) | cardinal_graph)
             + pynutil.insert('"')
         )
-        currency_minor = pynutil.insert('currency_min: "') + pynutil.insert("centiles") + pynutil.insert('"')
+        currency_minor = pynutil.insert('currency_min: "centiles"')
         quantity = pynutil.insert('quantity:"') + quantities + pynutil.insert('"')
         optional_slash_dash = pynini.closure(
             pynutil.add_weight(pynini.closure(pynini.accep(" "), 0, 1) + pynutil.delete("/-"), -0.1),
@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.ne.graph_utils import (
     NEMO_CHAR,
     NEMO_DIGIT,
@@ -33,7 +34,7 @@ arabic_to_Nepali_digit = pynini.string_map([
 arabic_to_Nepali_number = pynini.closure(arabic_to_Nepali_digit).optimize()
 
 # Load math operations and Greek letters
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 greek_letters = pynini.string_file(get_abs_path("data/greek.tsv"))
 
 
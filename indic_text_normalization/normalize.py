@@ -35,6 +35,7 @@ from indic_text_normalization.data_loader_utils import (
     post_process_punct,
     pre_process,
 )
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_table
 from indic_text_normalization.preprocessing_utils import additional_split
 from indic_text_normalization.token_parser import PRESERVE_ORDER_KEY, TokenParser
 from indic_text_normalization.logging import logger
@@ -43,6 +44,14 @@ from indic_text_normalization.logging import logger
 sys.setrecursionlimit(3000)
 
 SPACE_DUP = re.compile(' {2,}')
+# Digit group separators, e.g. 1,00,000 -> 100000, removed before tagging instead of inside the grammars
+BN_DIGIT_GROUP_COMMA = re.compile(r'(?<=[0-9০-৯]),(?=[0-9০-৯])')
+# Standalone Arabic integers read by the Bengali cardinal: up to 9 digits without leading zeros,
+# so codes such as 007 and phone numbers are left to the other taggers
+BN_ARABIC_NUMBER = re.compile(r'(?<!\S)-?(?:0|[1-9][0-9]{0,8})(?!\S)')
+ARABIC_TO_BENGALI = arabic_to_native_table(BENGALI_DIGITS)
+# Non-negative Bengali integers without leading zeros, read directly by the Bengali cardinal
+BN_PLAIN_INTEGER = re.compile(r'০|[১-৯][০-৯]{0,8}')
 
 # Supported language codes (must match folder names in text_normalization/)
 # Uses standard ISO 639 codes: ISO 639-1 (2-letter) or ISO 639-3 (3-letter)
@@ -360,33 +369,44 @@ class Normalizer:
                 if sym in text:
                     text = text.replace(sym, f" {word} ")
             text = SPACE_DUP.sub(" ", text).strip()
-        text = pynini.escape(text)
-        tagged_lattice = self.find_tags(text)
-        tagged_text = Normalizer.select_tag(tagged_lattice)
-        logger.debug(tagged_text)
-
-        self.parser(tagged_text)
-        tokens = self.parser.parse()
-        split_tokens = self._split_tokens_to_reduce_number_of_permutations(tokens)
-        output = ""
-        for s in split_tokens:
-            try:
-                tags_reordered = self.generate_permutations(s)
-                verbalizer_lattice = None
-                for tagged_text in tags_reordered:
-                    tagged_text = pynini.escape(tagged_text)
-
-                    verbalizer_lattice = self.find_verbalizer(tagged_text)
-                    if verbalizer_lattice.num_states() != 0:
-                        break
-                if verbalizer_lattice is None:
-                    logger.warning(f"No permutations were generated from tokens {s}")
+        if self.lang == "bn":
+            text = BN_DIGIT_GROUP_COMMA.sub("", text)
+            # The taggers read Arabic digits by mapping them to Bengali digits inside the grammar,
+            # so plain numbers are transliterated up front and tagged on the Bengali digit paths
+            text = BN_ARABIC_NUMBER.sub(lambda m: m.group().translate(ARABIC_TO_BENGALI), text)
+        if self.lang == "bn" and BN_PLAIN_INTEGER.fullmatch(text):
+            # A plain integer can only be tagged as a cardinal, so it is read without the grammars
+            from indic_text_normalization.bn.taggers.cardinal import CardinalFst as BnCardinalFst
+
+            output = BnCardinalFst.verbalize_int(int(text))
+        else:
+            text = pynini.escape(text)
+            tagged_lattice = self.find_tags(text)
+            tagged_text = Normalizer.select_tag(tagged_lattice)
+            logger.debug(tagged_text)
+
+            self.parser(tagged_text)
+            tokens = self.parser.parse()
+            split_tokens = self._split_tokens_to_reduce_number_of_permutations(tokens)
+            output = ""
+            for s in split_tokens:
+                try:
+                    tags_reordered = self.generate_permutations(s)
+                    verbalizer_lattice = None
+                    for tagged_text in tags_reordered:
+                        tagged_text = pynini.escape(tagged_text)
+
+                        verbalizer_lattice = self.find_verbalizer(tagged_text)
+                        if verbalizer_lattice.num_states() != 0:
+                            break
+                    if verbalizer_lattice is None:
+                        logger.warning(f"No permutations were generated from tokens {s}")
+                        return text
+                    output += ' ' + Normalizer.select_verbalizer(verbalizer_lattice)
+                except Exception as e:
+                    logger.warning("Failed text: " + text + str(e))
                     return text
-                output += ' ' + Normalizer.select_verbalizer(verbalizer_lattice)
-            except Exception as e:
-                logger.warning("Failed text: " + text + str(e))
-                return text
-        output = SPACE_DUP.sub(' ', output[1:])
+            output = SPACE_DUP.sub(' ', output[1:])
 
         if self.post_processor is not None:
             output = self.post_process(output)
@@ -700,3 +720,21 @@ class Normalizer:
         if self.post_processor is not None:
             normalized_text = top_rewrite(normalized_text, self.post_processor.fst)
         return normalized_text
+
+
+def warmup(langs: Optional[List[str]] = None, **kwargs) -> Dict[str, Normalizer]:
+    """
+    Builds the normalizers of several languages up front, e.g. at server startup,
+    so the first requests do not pay for grammar construction.
+    The normalizers are built one after the other on the calling thread: grammar construction holds the GIL,
+    so threads would not build them any faster. Within a language, the taggers can be built in worker
+    processes instead, see indic_text_normalization.graph_build.
+
+    Args:
+        langs: language codes to build, by default all SUPPORTED_LANGUAGES
+        kwargs: passed through to Normalizer, e.g. input_case or cache_dir
+
+    Returns: mapping of language code to its Normalizer
+    """
+    langs = SUPPORTED_LANGUAGES if langs is None else langs
+    return {lang: Normalizer(lang=lang, **kwargs) for lang in langs}
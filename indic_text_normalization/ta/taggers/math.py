@@ -15,6 +15,7 @@
 import pynini
 from pynini.lib import pynutil
 
+from indic_text_normalization.graph_cache import load_string_file
 from indic_text_normalization.ta.graph_utils import (
     NEMO_DIGIT,
     NEMO_TA_DIGIT,
@@ -32,7 +33,7 @@ arabic_to_tamil_digit = pynini.string_map([
 arabic_to_tamil_number = pynini.closure(arabic_to_tamil_digit).optimize()
 
 # Load math operations
-math_operations = pynini.string_file(get_abs_path("data/math_operations.tsv"))
+math_operations = load_string_file(get_abs_path("data/math_operations.tsv"))
 
 
 class MathFst(GraphFst):
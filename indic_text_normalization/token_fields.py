@@ -0,0 +1,56 @@
+# Copyright (c) 2025, Kenpath Technologies Pvt Ltd.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import List, Union
+
+import pynini
+from pynini.lib import pynutil
+
+
+def field(name: str, value: Union[str, 'pynini.FstLike'] = "") -> List[Union[str, 'pynini.FstLike']]:
+    """
+    Returns the parts of a token field, name: "...", for concat
+
+    Args:
+        name: field name
+        value: graph of the field value, or a constant value to insert, empty by default
+    """
+    if isinstance(value, str):
+        return [f"{name}: \"{value}\""]
+    return [f"{name}: \"", value, "\""]
+
+
+def concat(*parts: Union[str, 'pynini.FstLike', List[Union[str, 'pynini.FstLike']]]) -> 'pynini.FstLike':
+    """
+    Concatenates graphs and text to insert, consecutive text is joined into a single insertion
+
+    Args:
+        parts: graphs, text to insert and lists of both, e.g. fields
+    """
+    flat = []
+    for part in parts:
+        flat.extend(part if isinstance(part, list) else [part])
+    graph = pynini.accep("")
+    text = ""
+    for part in flat:
+        if isinstance(part, str):
+            text += part
+            continue
+        if text:
+            graph += pynutil.insert(text)
+            text = ""
+        graph += part
+    if text:
+        graph += pynutil.insert(text)
+    return graph
@@ -0,0 +1,61 @@
+"""
+Checks that the Bengali plain integer fast path in Normalizer.normalize reads numbers exactly like
+the cardinal grammar it bypasses.
+
+Run with:
+    python -m pytest tests/test_bn_cardinal.py
+"""
+import random
+import sys
+from pathlib import Path
+
+import pytest
+from pynini.lib.rewrite import top_rewrite
+
+# Add project root to sys.path to allow imports
+project_root = Path(__file__).parent.parent
+sys.path.append(str(project_root))
+
+from indic_text_normalization.bn.taggers.cardinal import CardinalFst, get_cardinal_fst
+from indic_text_normalization.digit_maps import BENGALI_DIGITS, arabic_to_native_table
+
+ARABIC_TO_BENGALI = arabic_to_native_table(BENGALI_DIGITS)
+MAX_INT = 10**9 - 1
+
+
+@pytest.fixture(scope="module")
+def number_graph():
+    return get_cardinal_fst(deterministic=True).final_graph
+
+
+def fst_reading(graph, n: int) -> str:
+    return top_rewrite(str(n).translate(ARABIC_TO_BENGALI), graph)
+
+
+def test_dense_range(number_graph):
+    mismatches = [n for n in range(20000) if CardinalFst.verbalize_int(n) != fst_reading(number_graph, n)]
+    assert mismatches == []
+
+
+def test_magnitude_boundaries(number_graph):
+    numbers = {MAX_INT}
+    for exponent in range(1, 9):
+        for prefix in range(1, 10):
+            base = prefix * 10**exponent
+            numbers.update({base - 1, base, base + 1})
+    mismatches = [n for n in sorted(numbers) if CardinalFst.verbalize_int(n) != fst_reading(number_graph, n)]
+    assert mismatches == []
+
+
+def test_random_samples(number_graph):
+    rng = random.Random(0)
+    # sample every number of digits equally, so that the larger tiers are not underrepresented
+    numbers = [rng.randint(10 ** (length - 1), 10**length - 1) for length in range(1, 10) for _ in range(500)]
+    mismatches = [n for n in numbers if CardinalFst.verbalize_int(n) != fst_reading(number_graph, n)]
+    assert mismatches == []
+
+
+@pytest.mark.parametrize("n", [-1, MAX_INT + 1])
+def test_out_of_range(n):
+    with pytest.raises(ValueError):
+        CardinalFst.verbalize_int(n)